@@ -1,6 +1,7 @@
+from functools import lru_cache
 from pathlib import Path
 
-from pydantic import field_validator
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -11,16 +12,15 @@ class GoogleSheetsConfig(BaseSettings):
     credentials_path: Path = Path(".client_secret.json")
     token_cache_path: Path = Path(".client_secret.token.json")
 
-    @field_validator("credentials_path")
-    @classmethod
-    def validate_credentials_file_exists(cls, v: Path) -> Path:
-        if not v.exists():
-            raise ValueError(
-                f"Credentials file not found: {v}. "
+    def ensure_credentials_exist(self) -> Path:
+        """Return the credentials path, checked only when it is about to be used."""
+        if not self.credentials_path.exists():
+            raise FileNotFoundError(
+                f"Credentials file not found: {self.credentials_path}. "
                 f"Please ensure you have the Google Sheets API credentials file. "
                 f"You can get it from: https://console.cloud.google.com/"
             )
-        return v
+        return self.credentials_path
 
 
 class AssetsConfig(BaseSettings):
@@ -43,8 +43,14 @@ class AppConfig(BaseSettings):
     )
 
     google_sheets: GoogleSheetsConfig
-    assets: AssetsConfig = AssetsConfig()
-    hugo: HugoConfig = HugoConfig()
+    assets: AssetsConfig = Field(default_factory=AssetsConfig)
+    hugo: HugoConfig = Field(default_factory=HugoConfig)
 
     debug: bool = False
     dry_run: bool = False
+
+
+@lru_cache(maxsize=1)
+def get_config() -> AppConfig:
+    """Load the application config once per process."""
+    return AppConfig()
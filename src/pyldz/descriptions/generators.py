@@ -1,6 +1,9 @@
 """Generators for meetup descriptions."""
 
+import json
 import logging
+import sys
+from functools import cached_property
 from pathlib import Path
 
 from ruamel.yaml import YAML
@@ -10,10 +13,20 @@ from pyldz.descriptions.models import (
     MeetupDescriptions,
     YouTubeRecordingDescription,
 )
-from pyldz.models import Language, Meetup, Speaker
+from pyldz.models import (
+    Language,
+    Meetup,
+    Speaker,
+    Talk,
+    load_yaml_files_together,
+)
 
 log = logging.getLogger(__name__)
 
+# Sponsor files are read-only data, so the safe (libyaml-backed when available)
+# loader is enough and much faster than the default round-trip mode.
+_yaml = YAML(typ="safe")
+
 
 AGENDA_TWO_TALKS = [
     AgendaItem(time="18:00", title="Rozpoczęcie i sprawy organizacyjne"),
@@ -44,6 +57,56 @@ AGENDA_ONE_TALK_EN = [
 ]
 
 
+def _format_agenda(agenda: list[AgendaItem]) -> str:
+    """Format agenda items as "HH:MM - title" lines."""
+    return "\n".join(f"{item.time} - {item.title}" for item in agenda)
+
+
+# Agendas keyed by (language, has_two_talks); there are only four possible
+# outputs, so their formatted forms are built up front
+_AGENDAS = {
+    (Language.PL, True): AGENDA_TWO_TALKS,
+    (Language.PL, False): AGENDA_ONE_TALK,
+    (Language.EN, True): AGENDA_TWO_TALKS_EN,
+    (Language.EN, False): AGENDA_ONE_TALK_EN,
+}
+_AGENDA_LINES = {key: _format_agenda(agenda) for key, agenda in _AGENDAS.items()}
+_AGENDA_SECTIONS = {key: "Agenda:\n" + lines for key, lines in _AGENDA_LINES.items()}
+
+# Month names indexed by month number (index 0 unused)
+_ENGLISH_MONTHS = (
+    None,
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+_POLISH_MONTHS = (
+    None,
+    "stycznia",
+    "lutego",
+    "marca",
+    "kwietnia",
+    "maja",
+    "czerwca",
+    "lipca",
+    "sierpnia",
+    "września",
+    "października",
+    "listopada",
+    "grudnia",
+)
+
+
 class SocialMediaLinks:
     """Social media links from Hugo config."""
 
@@ -56,112 +119,683 @@ class SocialMediaLinks:
     YOUTUBE = "https://www.youtube.com/@pythonlodz"
 
 
+def _build_community_links(website_label: str, bullet: str) -> str:
+    """Build the list of community links with the given bullet."""
+    return "\n".join(
+        [
+            f"{bullet} {website_label}: {SocialMediaLinks.OFFICIAL_WEBSITE}",
+            f"{bullet} Meetup: {SocialMediaLinks.MEETUP}",
+            f"{bullet} Discord: {SocialMediaLinks.DISCORD}",
+            f"{bullet} Facebook: {SocialMediaLinks.FACEBOOK}",
+            f"{bullet} LinkedIn: {SocialMediaLinks.LINKEDIN}",
+            f"{bullet} Instagram: {SocialMediaLinks.INSTAGRAM}",
+            f"{bullet} YouTube: {SocialMediaLinks.YOUTUBE}",
+        ]
+    )
+
+
+_ARROW = "➡️"
+
+_COMMUNITY_LINKS = {
+    Language.PL: _build_community_links("Oficjalna strona", _ARROW),
+    Language.EN: _build_community_links("Official website", _ARROW),
+}
+
+_COMMUNITY_LINKS_MD = {
+    Language.PL: _build_community_links("Oficjalna strona", "-"),
+    Language.EN: _build_community_links("Official website", "-"),
+}
+
+# Short translated labels, looked up by language instead of branching on it
+_LABELS = {
+    Language.PL: {
+        "links": "Linki do społeczności:",
+        "talks": "Prezentacje:",
+        "tba_talks": "Prezentacje będą wkrótce ogłoszone!",
+        "sponsors": "Sponsorzy:",
+        "no_sponsors": "Brak informacji o sponsorach.",
+        "description": "Opis:",
+        "speaker": "Prelegent",
+        "and": " oraz ",
+        "and_last": " oraz ",
+    },
+    Language.EN: {
+        "links": "Links to our community:",
+        "talks": "Presentations:",
+        "tba_talks": "Presentations will be announced soon!",
+        "sponsors": "Sponsors:",
+        "no_sponsors": "No sponsor information.",
+        "description": "Description:",
+        "speaker": "Speaker",
+        "and": " and ",
+        "and_last": ", and ",
+    },
+}
+
+# Labelled links block appended to every talk recording description
+_COMMUNITY_LINKS_SECTION = {
+    lang: f"{labels['links']}\n{_COMMUNITY_LINKS[lang]}"
+    for lang, labels in _LABELS.items()
+}
+
+# Shared layout of the YouTube live and recording descriptions
+_YOUTUBE_DESCRIPTION_TEMPLATE = """\
+{header}
+
+📅 {date_long}
+🕕 {time}
+📍 {location}
+
+Agenda:
+
+{agenda}
+
+{links_label}
+{community_links}
+
+{talks_label}
+
+{talks}"""
+
+# Opening paragraph of the meetup.com description, before and after the
+# talks are announced
+_MEETUP_COM_LEADS = {
+    Language.PL: {
+        "tba": (
+            "{date} o {time} spotykamy się w {location} "
+            "na kolejnym wieczorze Python Łódź. "
+            "Szczegóły agendy ogłosimy wkrótce, ale już teraz warto wpisać "
+            "ten termin do kalendarza, jeśli chcesz połączyć konkretną wiedzę "
+            "z rozmowami z lokalną społecznością."
+        ),
+        "talks": (
+            "{date} o {time} spotykamy się w {location} "
+            "na {talks_label}: {talk_titles}. "
+            "To dobry moment, żeby wpaść po konkretną wiedzę techniczną, a przy okazji "
+            "poznać ludzi z lokalnej społeczności Python Łódź."
+        ),
+        "talk_single": "prezentacji",
+        "talk_plural": "prezentacjach",
+        "talks_intro": (
+            "Tego wieczoru skupiamy się na praktycznych tematach, które powinny zainteresować "
+            "zarówno osoby pracujące z Pythonem na co dzień, jak i tych, którzy chcą zobaczyć "
+            "realne przykłady z projektów i codziennej pracy."
+        ),
+    },
+    Language.EN: {
+        "tba": (
+            "On {date} at {time} we meet at {location} "
+            "for another Python Łódź evening. "
+            "We will share the agenda soon, but it is already worth saving the date "
+            "if you want a mix of practical knowledge and conversations with the local community."
+        ),
+        "talks": (
+            "On {date} at {time} we meet at {location} "
+            "for {talks_label}: {talk_titles}. "
+            "It is a good evening to drop by for practical technical knowledge "
+            "and to meet people from the local Python Łódź community."
+        ),
+        "talk_single": "presentation",
+        "talk_plural": "presentations",
+        "talks_intro": (
+            "This evening focuses on practical topics that should appeal both to people "
+            "who use Python every day and to those who want to see real examples from projects "
+            "and day-to-day engineering work."
+        ),
+    },
+}
+
+# Layout of the meetup.com event description
+_MEETUP_COM_TEMPLATES = {
+    Language.EN: """\
+{lead}
+
+🗓️ What does the evening look like?
+
+We start with presentations and questions for the speakers, move naturally into smaller conversations during the break, and after the official part many people stay longer for more technical discussion and informal networking.
+
+👋 Who is this meetup for?
+
+This meetup is for technical people in Łódź who want to get to know Python Łódź better, and also for those who are still figuring out whether this kind of meetup is for them. If you are interested in Python, developer tooling, or simply want to hear practical talks and chat with people from the industry, you should feel comfortable here.
+
+🎤 Presentations
+
+{talks_intro}{talks}
+
+🕒 Agenda
+
+{agenda}
+
+🔗 Where to find us?
+
+{community_links}""",
+    Language.PL: """\
+{lead}
+
+🗓️ Jak wygląda ten wieczór?
+
+Zaczynamy od prezentacji i pytań do prelegentów, w przerwie szybko przechodzimy do rozmów w mniejszych grupach, a po części oficjalnej wiele osób zostaje jeszcze na dalszą integrację i techniczne dyskusje.
+
+👋 Dla kogo jest to spotkanie?
+
+To spotkanie jest dla osób technicznych z Łodzi, które chcą poznać Python Łódź od środka, ale też dla tych, którzy dopiero sprawdzają, czy taki meetup jest dla nich. Jeśli interesuje Cię Python, narzędzia developerskie albo po prostu chcesz posłuchać konkretnych prezentacji i pogadać z ludźmi z branży, odnajdziesz się tutaj bez problemu.
+
+🎤 Prelekcje
+
+{talks_intro}{talks}
+
+🕒 Agenda
+
+{agenda}
+
+🔗 Gdzie nas znaleźć?
+
+{community_links}""",
+}
+
+# Super prompt for generating social media posts
+_CHATGPT_PROMPT_TEMPLATES = {
+    Language.EN: """\
+# Super Prompt for Generating Social Media Posts
+
+## Meeting Information
+
+**Meeting number:** Meetup #{meetup_id}
+**Date:** {date_long}
+**Time:** {time}
+**Location:** {location}
+
+## Presentations
+
+{talks}
+## Agenda
+
+{agenda}
+
+## Sponsors
+
+{sponsors_info}
+
+## Links to Our Community
+
+{community_links}
+
+## Instructions for Generating Posts
+
+Based on the above information, prepare a series of posts for Facebook, Discord and Email that:
+
+1. **Speaker Posts** - one post for each speaker:
+   - Introduce the speaker and their presentation
+   - Highlight the key points of the presentation
+   - Encourage participation in the meeting
+   - Add link to the meeting page
+
+2. **Sponsor Posts** - one post for each sponsor:
+   - Thank the sponsor for their support
+   - Briefly describe what the sponsor does
+   - Add link to the sponsor's website
+   - Encourage following them on social media
+
+3. **Informative Posts** - 2 weeks before the meeting which will be {date_long}:
+   - Reminders about the upcoming meeting
+   - Interesting facts about presentations
+   - Information about live streaming
+   - Invitations to join the community
+
+4. **Live Stream Post** - a few days before the meeting:
+   - Information that the meeting will be streamed live
+   - Link to the stream
+   - Encouragement to watch online
+
+## Post Formatting Guidelines
+
+- **Tone:** Professional but friendly, casual, open
+- **Target audience:** Python programmers and people who want to learn it
+- **Emoji:** Use sparingly to highlight important information and emotions
+- **Each post should include:** Link to the meeting page
+- **Format:** Each post should be ready to paste directly on social media
+- **Dash:** Use the "-" character as a dash in descriptions
+
+## Example Post Formatting
+
+```
+🎉 Python Łódź meetup in a week!
+
+We're waiting for you on Friday at 18:00 at IndieBI 🚀
+
+This time we'll be talking about:
+✨ Clean architecture in Django
+✨ Visualizations in Python
+
+Sign up: [link to meetup]
+Live stream: [link to page]
+
+Join us on Discord: [link to Discord]
+```
+
+## Additional Information
+
+- Meetings have a casual format, preferring a family/friendly/open atmosphere
+- Posts should be scheduled 2 weeks before the meeting which will be {date_long}
+- Each post should be unique and not repeat itself
+- Posts can contain questions for the community
+- Encourage inviting friends
+
+## Image Generation Guidelines
+
+When generating images for posts:
+- **Aspect ratio:** Always use 4:5 ratio (e.g., 1080x1350 pixels)
+- **Logo:** Every image must include the uploaded Python Łódź logo
+- **Logo placement:** The logo should be visible but not dominant
+
+## Prepare Posts in the Following Format
+
+For each post provide:
+1. **Publication date** (2 weeks before the meeting which will be {date_long})
+2. **Platform** (Facebook/Discord/Email)
+3. **Post content** (ready to paste)
+4. **Image prompt** (if an image should be included):
+   - Top content (text at the top of the image)
+   - Bottom content (text at the bottom of the image)
+
+Start preparing posts! 🚀""",
+    Language.PL: """\
+# Super Prompt do Generowania Postów na Social Media
+
+## Informacje o Spotkaniu
+
+**Numer spotkania:** Meetup #{meetup_id}
+**Data:** {date_long}
+**Godzina:** {time}
+**Miejsce:** {location}
+
+## Prezentacje
+
+{talks}
+## Agenda
+
+{agenda}
+
+## Sponsorzy
+
+{sponsors_info}
+
+## Linki do Społeczności
+
+{community_links}
+
+## Instrukcje do Generowania Postów
+
+Na podstawie powyższych informacji przygotuj serię postów na Facebook, Discord oraz Mail które:
+
+1. **Posty o Prelegentach** - jeden post dla każdego prelegenta:
+   - Przedstaw prelegenta i jego prezentację
+   - Podkreśl najważniejsze punkty prezentacji
+   - Zachęć do udziału w spotkaniu
+   - Dodaj link do strony spotkania
+
+2. **Posty o Sponsorach** - jeden post dla każdego sponsora:
+   - Podziękuj sponsorowi za wsparcie
+   - Opisz krótko czym się zajmuje sponsor
+   - Dodaj link do strony sponsora
+   - Zachęć do śledzenia ich na social mediach
+
+3. **Posty Informacyjne** - na 2 tygodni przed spotkaniem które będzie {date_long}:
+   - Przypomnienia o zbliżającym się spotkaniu
+   - Ciekawostki o prezentacjach
+   - Informacje o transmisji live
+   - Zaproszenia do dołączenia do społeczności
+
+4. **Post o Transmisji Live** - kilka dni przed spotkaniem:
+   - Informacja że spotkanie będzie transmitowane na żywo
+   - Link do transmisji
+   - Zachęta do oglądania online
+
+## Wytyczne do Formatowania Postów
+
+- **Ton:** Profesjonalny ale przyjazny, luźny, otwarty
+- **Grupa docelowa:** Programiści Pythona i osoby chcące się go nauczyć
+- **Emoji:** Używaj z umiarkowaniem do podkreślania ważnych informacji i emocji
+- **Każdy post powinien zawierać:** Link do strony spotkania
+- **Format:** Każdy post powinien być gotowy do wklejenia bezpośrednio na social media
+- **Myślnik:** Używaj znaku "-" jako myślnika w opisach
+
+## Przykład Formatowania Posta
+
+```
+🎉 Już za tydzień spotkanie Python Łódź!
+
+Czekamy na Was w piątek o 18:00 w IndieBI 🚀
+
+Tym razem będziemy mówić o:
+✨ Czystej architekturze w Django
+✨ Wizualizacjach w Pythonie
+
+Zapisy: [link do meetupu]
+Transmisja live: [link do strony]
+
+Dołącz do nas na Discordzie: [link do Discorda]
+```
+
+## Dodatkowe Informacje
+
+- Spotkania mają luźną formę, preferuje się rodzinny/przyjacielski/otwarty klimat
+- Posty mają być zaplanowane na 2 tygodni przed spotkaniem które będzie {date_long}
+- Każdy post powinien być unikalny i nie powtarzać się
+- Posty mogą zawierać pytania do społeczności
+- Zachęcaj do zapraszania znajomych
+
+## Wytyczne do Generowania Obrazków
+
+Podczas generowania obrazków do postów:
+- **Format obrazka:** Zawsze używaj proporcji 4:5 (np. 1080x1350 pikseli)
+- **Logo:** Każdy obrazek musi zawierać uploadowane logo Python Łódź
+- **Umiejscowienie logo:** Logo powinno być widoczne ale nie dominujące
+
+## Przygotuj Posty w Następującym Formacie
+
+Dla każdego posta podaj:
+1. **Data publikacji** (na 2 tygodni przed spotkaniem które będzie {date_long})
+2. **Platforma** (Facebook/Discord/Mail)
+3. **Treść posta** (gotowa do wklejenia)
+4. **Prompt do obrazka** (jeśli ma być dołączony obraz):
+   - Górna treść (tekst na górze obrazka)
+   - Dolna treść (tekst na dole obrazka)
+
+Zacznij od przygotowania postów! 🚀""",
+}
+
+
+# Parsed sponsor files keyed by resolved path: (mtime, size, data)
+_SPONSOR_FILE_CACHE: dict[Path, tuple[float, int, dict]] = {}
+
+# Shared repositories keyed by resolved sponsors directory
+_REPO_CACHE: dict[Path, "SponsorRepository"] = {}
+
+
+def _intern_keys(data):
+    """Intern top-level keys of parsed sponsor data so lookups compare by identity."""
+    if isinstance(data, dict):
+        return {sys.intern(k) if isinstance(k, str) else k: v for k, v in data.items()}
+    return data
+
+
 class SponsorRepository:
     """Load sponsor data from YAML files."""
 
-    def __init__(self, sponsors_dir: Path):
+    __slots__ = (
+        "sponsors_dir",
+        "cache_file",
+        "_cache",
+        "_resolved_dir",
+        "_cache_file_stale",
+    )
+
+    def __init__(self, sponsors_dir: Path, cache_file: Path | None = None):
+        """
+        Initialize repository.
+
+        Args:
+            sponsors_dir: Path to directory containing sponsor YAML files
+            cache_file: Optional JSON file persisting parsed sponsors between runs
+        """
         self.sponsors_dir = sponsors_dir
-        self._cache: dict[str, dict] = {}
-        self._load_all_sponsors()
-
-    def _load_all_sponsors(self) -> None:
-        """Load all sponsor YAML files into cache."""
-        yaml = YAML()
-        if not self.sponsors_dir.exists():
-            log.warning(f"Sponsors directory not found: {self.sponsors_dir}")
+        self.cache_file = cache_file
+        # Resolved once so per-file cache keys need no realpath() syscalls
+        self._resolved_dir = sponsors_dir.resolve()
+        if not self._resolved_dir.is_dir():
+            log.warning("Sponsors directory not found: %s", sponsors_dir)
+        # Sponsors are loaded on first access; None marks a missing sponsor
+        self._cache: dict[str, dict | None] = {}
+        # Set when a file was parsed since the JSON cache file was last written
+        self._cache_file_stale = False
+        if cache_file is not None:
+            self._read_cache_file(cache_file)
+
+    @classmethod
+    def for_dir(
+        cls, sponsors_dir: Path, cache_file: Path | None = None
+    ) -> "SponsorRepository":
+        """Get a shared repository for the directory, refreshing changed files."""
+        key = sponsors_dir.resolve()
+        repo = _REPO_CACHE.get(key)
+        if repo is None:
+            repo = cls(sponsors_dir, cache_file)
+            _REPO_CACHE[key] = repo
+        else:
+            repo._cache.clear()
+            if cache_file is not None and cache_file != repo.cache_file:
+                repo.cache_file = cache_file
+                repo._read_cache_file(cache_file)
+        return repo
+
+    def _load_sponsor(self, sponsor_id: str) -> dict | None:
+        """Load a single sponsor YAML file."""
+        sponsor_file = self._sponsor_file(sponsor_id)
+        try:
+            data = self._load_sponsor_file(sponsor_file)
+        except FileNotFoundError:
+            log.debug("Sponsor file not found: %s", sponsor_file)
+            return None
+        except Exception as e:
+            log.error("Failed to load sponsor %s: %s", sponsor_id, e)
+            return None
+
+        if not data:
+            return None
+        log.debug("Loaded sponsor: %s", sponsor_id)
+        return data
+
+    def _sponsor_file(self, sponsor_id: str) -> Path:
+        """Path of a sponsor's YAML file, also used as its parsed-file cache key."""
+        return self._resolved_dir / f"{sponsor_id}.yaml"
+
+    def _load_sponsor_file(self, sponsor_file: Path) -> dict:
+        """Parse a sponsor file, reusing the previous result if it is unchanged."""
+        stat = sponsor_file.stat()
+        cached = _SPONSOR_FILE_CACHE.get(sponsor_file)
+        if cached and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+            return cached[2]
+
+        data = _intern_keys(_yaml.load(sponsor_file.read_text(encoding="utf-8")))
+        _SPONSOR_FILE_CACHE[sponsor_file] = (stat.st_mtime, stat.st_size, data)
+        self._cache_file_stale = True
+        return data
+
+    def _read_cache_file(self, cache_file: Path) -> None:
+        """Seed the parsed-file cache from the JSON cache file."""
+        try:
+            entries = json.loads(cache_file.read_text(encoding="utf-8"))
+            seeded = {
+                Path(path): (mtime, size, _intern_keys(data))
+                for path, (mtime, size, data) in entries.items()
+            }
+        except FileNotFoundError:
+            return
+        except (OSError, AttributeError, TypeError, ValueError) as e:
+            log.warning("Ignoring unreadable sponsors cache %s: %s", cache_file, e)
             return
 
-        for sponsor_file in self.sponsors_dir.glob("*.yaml"):
-            sponsor_id = sponsor_file.stem
+        for path, entry in seeded.items():
+            _SPONSOR_FILE_CACHE.setdefault(path, entry)
+
+    def _write_cache_file(self, cache_file: Path) -> None:
+        """Persist parsed files from this directory to the JSON cache file."""
+        entries = {
+            str(path): entry
+            for path, entry in _SPONSOR_FILE_CACHE.items()
+            if path.parent == self._resolved_dir
+        }
+        try:
+            # No default=str: data that JSON cannot represent exactly (e.g.
+            # dates) is not cached rather than read back as something else
+            content = json.dumps(entries, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            log.debug("Not caching sponsors in %s: %s", cache_file, e)
+            return
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(content, encoding="utf-8")
+        except OSError as e:
+            log.warning("Failed to write sponsors cache %s: %s", cache_file, e)
+
+    def _parse_files_together(self, sponsor_files: list[Path]) -> None:
+        """
+        Parse changed sponsor files as one multi-document YAML stream.
+
+        Only seeds the parsed-file cache. If the files cannot be joined without
+        changing what they parse to (see ``load_yaml_files_together``) or the
+        stream fails to parse, nothing is cached and the files are parsed one
+        by one on access instead.
+        """
+        stale = []
+        for key in sponsor_files:
             try:
-                with open(sponsor_file, encoding="utf-8") as f:
-                    data = yaml.load(f)
-                    if data:
-                        self._cache[sponsor_id] = data
-                        log.debug(f"Loaded sponsor: {sponsor_id}")
-            except Exception as e:
-                log.error(f"Failed to load sponsor {sponsor_id}: {e}")
+                stat = key.stat()
+            except OSError:
+                continue
+            cached = _SPONSOR_FILE_CACHE.get(key)
+            if cached and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+                continue
+            try:
+                stale.append((key, stat, key.read_text(encoding="utf-8")))
+            except OSError:
+                continue
+
+        if len(stale) < 2:
+            return
+
+        try:
+            documents = load_yaml_files_together(_yaml, [text for _, _, text in stale])
+        except Exception as e:
+            log.debug("Batch sponsor parse failed, parsing files separately: %s", e)
+            return
+        if documents is None:
+            return
+
+        for (key, stat, _), data in zip(stale, documents):
+            _SPONSOR_FILE_CACHE[key] = (stat.st_mtime, stat.st_size, _intern_keys(data))
+        self._cache_file_stale = True
+
+    def _flush_cache_file(self) -> None:
+        """Write the JSON cache file once if any sponsor file was parsed."""
+        if self._cache_file_stale and self.cache_file is not None:
+            self._write_cache_file(self.cache_file)
+        self._cache_file_stale = False
+
+    def _get_sponsor(self, sponsor_id: str) -> dict | None:
+        if sponsor_id not in self._cache:
+            self._cache[sponsor_id] = self._load_sponsor(sponsor_id)
+        return self._cache[sponsor_id]
 
     def get_sponsor(self, sponsor_id: str) -> dict | None:
         """Get sponsor data by ID."""
-        return self._cache.get(sponsor_id)
+        sponsor = self._get_sponsor(sponsor_id)
+        self._flush_cache_file()
+        return sponsor
+
+    def get_sponsors(self, sponsor_ids: list[str]) -> list[dict | None]:
+        """Get data for several sponsors, parsing changed files in one pass."""
+        missing = [
+            sponsor_id for sponsor_id in sponsor_ids if sponsor_id not in self._cache
+        ]
+        if len(missing) > 1:
+            self._parse_files_together(
+                [self._sponsor_file(sponsor_id) for sponsor_id in missing]
+            )
+        sponsors = [self._get_sponsor(sponsor_id) for sponsor_id in sponsor_ids]
+        self._flush_cache_file()
+        return sponsors
 
 
 class MeetupDescriptionGenerator:
     """Generate all types of descriptions for a meetup."""
 
+    # No __slots__ here: the cached_property sections are stored in __dict__
+
     def __init__(
         self,
         meetup: Meetup,
         speakers: list[Speaker],
         sponsors_dir: Path,
+        sponsors_cache_file: Path | None = None,
     ):
         self.meetup = meetup
         self.speakers = speakers
-        self.sponsor_repo = SponsorRepository(sponsors_dir)
+        self._speakers_by_id = {speaker.id: speaker for speaker in speakers}
+        self.sponsor_repo = SponsorRepository.for_dir(sponsors_dir, sponsors_cache_file)
+
+    @cached_property
+    def _talks_with_speakers(self) -> tuple[tuple[Talk, str], ...]:
+        """Meetup talks paired with their speaker names."""
+        return tuple(
+            (talk, self._get_speaker_name(talk.speaker_id))
+            for talk in self.meetup.talks
+        )
+
+    @cached_property
+    def formatted_date(self) -> str:
+        """Meetup date as DD.MM.YYYY."""
+        return self._format_date()
+
+    @cached_property
+    def formatted_date_long(self) -> str:
+        """Meetup date in the long form of the meetup language."""
+        return self._format_date_long()
+
+    @cached_property
+    def location_name(self) -> str:
+        """Venue name in the meetup language."""
+        return self.meetup.location_name(self.meetup.language)
+
+    @cached_property
+    def talks_section(self) -> str:
+        """Talks section in the meetup language."""
+        return self._build_talks_section()
+
+    @cached_property
+    def agenda_section(self) -> str:
+        """Agenda section in the meetup language."""
+        return self._build_agenda_section()
+
+    @cached_property
+    def sponsors_section(self) -> str:
+        """Sponsors section in the meetup language."""
+        return self._build_sponsors_section()
+
+    @cached_property
+    def sponsors_info(self) -> str:
+        """Detailed sponsors information in the meetup language."""
+        return self._build_sponsors_info()
 
     def _get_agenda(self, language: Language | None = None) -> list[AgendaItem]:
         """Get appropriate agenda based on number of talks and language."""
         lang = language or self.meetup.language
-        if self.meetup.has_two_talks:
-            return AGENDA_TWO_TALKS_EN if lang == Language.EN else AGENDA_TWO_TALKS
-        else:
-            return AGENDA_ONE_TALK_EN if lang == Language.EN else AGENDA_ONE_TALK
-
-    def _get_text(self, pl: str, en: str, language: Language | None = None) -> str:
-        """Get text in the specified language."""
-        lang = language or self.meetup.language
-        return en if lang == Language.EN else pl
+        return _AGENDAS[(lang, self.meetup.has_two_talks)]
 
     def _format_date(self) -> str:
         """Format date as DD.MM.YYYY."""
-        return self.meetup.date.strftime("%d.%m.%Y")
+        d = self.meetup.date
+        return f"{d.day:02d}.{d.month:02d}.{d.year:04d}"
 
     def _format_date_long(self, language: Language | None = None) -> str:
         """Format date in a long, language-specific form."""
         lang = language or self.meetup.language
+        d = self.meetup.date
 
         if lang == Language.EN:
-            months = {
-                1: "January",
-                2: "February",
-                3: "March",
-                4: "April",
-                5: "May",
-                6: "June",
-                7: "July",
-                8: "August",
-                9: "September",
-                10: "October",
-                11: "November",
-                12: "December",
-            }
-            month_name = months[self.meetup.date.month]
-            return f"{month_name} {self.meetup.date.day}, {self.meetup.date.year}"
-
-        months = {
-            1: "stycznia",
-            2: "lutego",
-            3: "marca",
-            4: "kwietnia",
-            5: "maja",
-            6: "czerwca",
-            7: "lipca",
-            8: "sierpnia",
-            9: "września",
-            10: "października",
-            11: "listopada",
-            12: "grudnia",
-        }
-        month_name = months[self.meetup.date.month]
-        return f"{self.meetup.date.day} {month_name} {self.meetup.date.year}"
+            return f"{_ENGLISH_MONTHS[d.month]} {d.day}, {d.year}"
+
+        return f"{d.day} {_POLISH_MONTHS[d.month]} {d.year}"
 
     def _get_speaker_by_id(self, speaker_id: str) -> Speaker | None:
         """Get speaker by ID."""
-        for speaker in self.speakers:
-            if speaker.id == speaker_id:
-                return speaker
-        return None
+        return self._speakers_by_id.get(speaker_id)
+
+    def _get_speaker_name(self, speaker_id: str) -> str:
+        """Get speaker name by ID, falling back to "Unknown"."""
+        speaker = self._get_speaker_by_id(speaker_id)
+        return speaker.name if speaker else "Unknown"
 
     def _format_talk_titles(self, language: Language | None = None) -> str:
         """Format talk titles as a natural-language list."""
@@ -173,166 +807,73 @@ class MeetupDescriptionGenerator:
         if len(titles) == 1:
             return titles[0]
         if len(titles) == 2:
-            connector = " oraz " if lang == Language.PL else " and "
-            return f"{titles[0]}{connector}{titles[1]}"
+            return f"{titles[0]}{_LABELS[lang]['and']}{titles[1]}"
 
-        connector = " oraz " if lang == Language.PL else ", and "
+        connector = _LABELS[lang]["and_last"]
         return f"{', '.join(titles[:-1])}{connector}{titles[-1]}"
 
     def _build_meetup_lead(self, language: Language | None = None) -> str:
         """Build the opening paragraph for meetup.com."""
         lang = language or self.meetup.language
-        date = self._format_date_long(lang)
-        location_name = self.meetup.location_name(lang)
-
-        if self.meetup.is_to_be_announced:
-            return self._get_text(
-                (
-                    f"{date} o {self.meetup.time} spotykamy się w {location_name} "
-                    "na kolejnym wieczorze Python Łódź. "
-                    "Szczegóły agendy ogłosimy wkrótce, ale już teraz warto wpisać "
-                    "ten termin do kalendarza, jeśli chcesz połączyć konkretną wiedzę "
-                    "z rozmowami z lokalną społecznością."
-                ),
-                (
-                    f"On {date} at {self.meetup.time} we meet at {location_name} "
-                    "for another Python Łódź evening. "
-                    "We will share the agenda soon, but it is already worth saving the date "
-                    "if you want a mix of practical knowledge and conversations with the local community."
-                ),
-                lang,
-            )
-
-        talks_label = self._get_text(
-            "prezentacji" if self.meetup.has_single_talk else "prezentacjach",
-            "presentation" if self.meetup.has_single_talk else "presentations",
-            lang,
+        date = (
+            self.formatted_date_long
+            if lang == self.meetup.language
+            else self._format_date_long(lang)
         )
-        talk_titles = self._format_talk_titles(lang)
-
-        return self._get_text(
-            (
-                f"{date} o {self.meetup.time} spotykamy się w {location_name} "
-                f"na {talks_label}: {talk_titles}. "
-                "To dobry moment, żeby wpaść po konkretną wiedzę techniczną, a przy okazji "
-                "poznać ludzi z lokalnej społeczności Python Łódź."
-            ),
-            (
-                f"On {date} at {self.meetup.time} we meet at {location_name} "
-                f"for {talks_label}: {talk_titles}. "
-                "It is a good evening to drop by for practical technical knowledge "
-                "and to meet people from the local Python Łódź community."
-            ),
-            lang,
+        location_name = (
+            self.location_name
+            if lang == self.meetup.language
+            else self.meetup.location_name(lang)
         )
 
-    def _build_meetup_evening_section(self, language: Language | None = None) -> str:
-        """Build the section describing the rhythm of the evening."""
-        lang = language or self.meetup.language
-        return self._get_text(
-            (
-                "Zaczynamy od prezentacji i pytań do prelegentów, w przerwie szybko "
-                "przechodzimy do rozmów w mniejszych grupach, a po części oficjalnej "
-                "wiele osób zostaje jeszcze na dalszą integrację i techniczne dyskusje."
-            ),
-            (
-                "We start with presentations and questions for the speakers, move naturally "
-                "into smaller conversations during the break, and after the official part "
-                "many people stay longer for more technical discussion and informal networking."
-            ),
-            lang,
-        )
+        texts = _MEETUP_COM_LEADS[lang]
+        if self.meetup.is_to_be_announced:
+            return texts["tba"].format(
+                date=date, time=self.meetup.time, location=location_name
+            )
 
-    def _build_meetup_audience_section(self, language: Language | None = None) -> str:
-        """Build the section clarifying who the meetup is for."""
-        lang = language or self.meetup.language
-        return self._get_text(
-            (
-                "To spotkanie jest dla osób technicznych z Łodzi, które chcą poznać Python Łódź "
-                "od środka, ale też dla tych, którzy dopiero sprawdzają, czy taki meetup jest dla nich. "
-                "Jeśli interesuje Cię Python, narzędzia developerskie albo po prostu chcesz posłuchać "
-                "konkretnych prezentacji i pogadać z ludźmi z branży, odnajdziesz się tutaj bez problemu."
-            ),
-            (
-                "This meetup is for technical people in Łódź who want to get to know Python Łódź better, "
-                "and also for those who are still figuring out whether this kind of meetup is for them. "
-                "If you are interested in Python, developer tooling, or simply want to hear practical talks "
-                "and chat with people from the industry, you should feel comfortable here."
-            ),
-            lang,
+        return texts["talks"].format(
+            date=date,
+            time=self.meetup.time,
+            location=location_name,
+            talks_label=texts[
+                "talk_single" if self.meetup.has_single_talk else "talk_plural"
+            ],
+            talk_titles=self._format_talk_titles(lang),
         )
 
     def _build_meetup_talks_intro(self, language: Language | None = None) -> str:
         """Build a short sentence opening the talks section."""
         lang = language or self.meetup.language
-        return self._get_text(
-            (
-                "Tego wieczoru skupiamy się na praktycznych tematach, które powinny zainteresować "
-                "zarówno osoby pracujące z Pythonem na co dzień, jak i tych, którzy chcą zobaczyć "
-                "realne przykłady z projektów i codziennej pracy."
-            ),
-            (
-                "This evening focuses on practical topics that should appeal both to people "
-                "who use Python every day and to those who want to see real examples from projects "
-                "and day-to-day engineering work."
-            ),
-            lang,
-        )
+        return _MEETUP_COM_LEADS[lang]["talks_intro"]
 
     def _build_meetup_agenda_lines(self, language: Language | None = None) -> str:
         """Build agenda lines without an extra heading."""
         lang = language or self.meetup.language
-        agenda = self._get_agenda(lang)
-        return "\n".join(f"{item.time} - {item.title}" for item in agenda)
-
-    def _build_meetup_links_footer(self, language: Language | None = None) -> str:
-        """Build a compact links footer for meetup.com."""
-        lang = language or self.meetup.language
-        website_label = self._get_text("Oficjalna strona", "Official website", lang)
-
-        return "\n".join(
-            [
-                f"➡️ {website_label}: {SocialMediaLinks.OFFICIAL_WEBSITE}",
-                f"➡️ Meetup: {SocialMediaLinks.MEETUP}",
-                f"➡️ Discord: {SocialMediaLinks.DISCORD}",
-                f"➡️ Facebook: {SocialMediaLinks.FACEBOOK}",
-                f"➡️ LinkedIn: {SocialMediaLinks.LINKEDIN}",
-                f"➡️ Instagram: {SocialMediaLinks.INSTAGRAM}",
-                f"➡️ YouTube: {SocialMediaLinks.YOUTUBE}",
-            ]
-        )
+        return _AGENDA_LINES[(lang, self.meetup.has_two_talks)]
 
     def _build_agenda_section(self, language: Language | None = None) -> str:
         """Build agenda section."""
         lang = language or self.meetup.language
-        agenda_label = "Agenda:" if lang == Language.PL else "Agenda:"
-        agenda = self._get_agenda(lang)
-        lines = [agenda_label]
-        for item in agenda:
-            lines.append(f"{item.time} - {item.title}")
-        return "\n".join(lines)
+        return _AGENDA_SECTIONS[(lang, self.meetup.has_two_talks)]
 
     def _build_talks_section(self, language: Language | None = None) -> str:
         """Build talks section with descriptions."""
         lang = language or self.meetup.language
         if self.meetup.is_to_be_announced:
-            return self._get_text(
-                "Prezentacje będą wkrótce ogłoszone!",
-                "Presentations will be announced soon!",
-                lang,
-            )
-
-        lines = []
-        for i, talk in enumerate(self.meetup.talks, 1):
-            speaker = self._get_speaker_by_id(talk.speaker_id)
-            speaker_name = speaker.name if speaker else "Unknown"
+            return _LABELS[lang]["tba_talks"]
 
-            lines.append(f"{i}. {talk.title} - {speaker_name}")
-            lines.append("")
-            lines.append(talk.description)
-            lines.append("")
+        # Each talk is followed by a blank line; the last one ends the section
+        return "".join(
+            f"{i}. {talk.title} - {speaker_name}\n\n{talk.description}\n\n"
+            for i, (talk, speaker_name) in enumerate(self._talks_with_speakers, 1)
+        )[:-1]
 
-        return "\n".join(lines)
+    @cached_property
+    def _sponsors(self) -> list[tuple[str, dict | None]]:
+        """Meetup sponsor IDs paired with their data."""
+        sponsor_ids = self.meetup.sponsors
+        return list(zip(sponsor_ids, self.sponsor_repo.get_sponsors(sponsor_ids)))
 
     def _build_sponsors_section(self, language: Language | None = None) -> str:
         """Build sponsors section."""
@@ -340,221 +881,85 @@ class MeetupDescriptionGenerator:
             return ""
 
         lang = language or self.meetup.language
-        sponsors_label = self._get_text("Sponsorzy:", "Sponsors:", lang)
-        lines = [sponsors_label]
-        for sponsor_id in self.meetup.sponsors:
-            sponsor = self.sponsor_repo.get_sponsor(sponsor_id)
-            if sponsor:
-                lines.append(f"- {sponsor.get('name', sponsor_id)}")
-
-        return "\n".join(lines)
-
-    def generate_meetup_com(self) -> str:
-        """Generate description for meetup.com."""
-        lang = self.meetup.language
-        parts = [
-            self._build_meetup_lead(lang),
-            self._get_text(
-                "🗓️ Jak wygląda ten wieczór?",
-                "🗓️ What does the evening look like?",
-                lang,
-            ),
-            self._build_meetup_evening_section(lang),
-            self._get_text(
-                "👋 Dla kogo jest to spotkanie?",
-                "👋 Who is this meetup for?",
-                lang,
-            ),
-            self._build_meetup_audience_section(lang),
-            self._get_text("🎤 Prelekcje", "🎤 Presentations", lang),
-        ]
-
-        if not self.meetup.is_to_be_announced:
-            parts.append(self._build_meetup_talks_intro(lang))
-
-        parts.extend(
+        return "\n".join(
             [
-                self._build_talks_section(lang),
-                self._get_text("🕒 Agenda", "🕒 Agenda", lang),
-                self._build_meetup_agenda_lines(lang),
-                self._get_text(
-                    "🔗 Gdzie nas znaleźć?",
-                    "🔗 Where to find us?",
-                    lang,
+                _LABELS[lang]["sponsors"],
+                *(
+                    f"- {sponsor.get('name', sponsor_id)}"
+                    for sponsor_id, sponsor in self._sponsors
+                    if sponsor
                 ),
-                self._build_meetup_links_footer(lang),
             ]
         )
 
-        return "\n\n".join(parts)
+    def generate_meetup_com(self) -> str:
+        """Generate description for meetup.com."""
+        lang = self.meetup.language
+        talks_intro = (
+            ""
+            if self.meetup.is_to_be_announced
+            else f"{self._build_meetup_talks_intro(lang)}\n\n"
+        )
+        return _MEETUP_COM_TEMPLATES[lang].format(
+            lead=self._build_meetup_lead(lang),
+            talks_intro=talks_intro,
+            talks=self.talks_section,
+            agenda=self._build_meetup_agenda_lines(lang),
+            community_links=_COMMUNITY_LINKS[lang],
+        )
 
     def generate_youtube_live(self) -> str:
         """Generate description for YouTube live stream."""
-        lang = self.meetup.language
-        location_name = self.meetup.location_name(lang)
-
-        if lang == Language.EN:
-            parts = [
-                f"🔴 LIVE: Python Łódź Meetup #{self.meetup.meetup_id}",
-                "",
-                f"📅 {self._format_date_long()}",
-                f"🕕 {self.meetup.time}",
-                f"📍 {location_name}",
-                "",
-                "Agenda:",
-                "",
-                self._build_agenda_section(lang),
-                "",
-                "Links to our community:",
-                f"➡️ Official website: {SocialMediaLinks.OFFICIAL_WEBSITE}",
-                f"➡️ Meetup: {SocialMediaLinks.MEETUP}",
-                f"➡️ Discord: {SocialMediaLinks.DISCORD}",
-                f"➡️ Facebook: {SocialMediaLinks.FACEBOOK}",
-                f"➡️ LinkedIn: {SocialMediaLinks.LINKEDIN}",
-                f"➡️ Instagram: {SocialMediaLinks.INSTAGRAM}",
-                f"➡️ YouTube: {SocialMediaLinks.YOUTUBE}",
-                "",
-                "Presentations:",
-                "",
-                self._build_talks_section(lang),
-            ]
-        else:
-            parts = [
-                f"🔴 LIVE: Python Łódź Meetup #{self.meetup.meetup_id}",
-                "",
-                f"📅 {self._format_date_long()}",
-                f"🕕 {self.meetup.time}",
-                f"📍 {location_name}",
-                "",
-                "Agenda:",
-                "",
-                self._build_agenda_section(lang),
-                "",
-                "Linki do społeczności:",
-                f"➡️ Oficjalna strona: {SocialMediaLinks.OFFICIAL_WEBSITE}",
-                f"➡️ Meetup: {SocialMediaLinks.MEETUP}",
-                f"➡️ Discord: {SocialMediaLinks.DISCORD}",
-                f"➡️ Facebook: {SocialMediaLinks.FACEBOOK}",
-                f"➡️ LinkedIn: {SocialMediaLinks.LINKEDIN}",
-                f"➡️ Instagram: {SocialMediaLinks.INSTAGRAM}",
-                f"➡️ YouTube: {SocialMediaLinks.YOUTUBE}",
-                "",
-                "Prezentacje:",
-                "",
-                self._build_talks_section(lang),
-            ]
-
-        return "\n".join(parts)
+        return self._build_youtube_description(
+            f"🔴 LIVE: Python Łódź Meetup #{self.meetup.meetup_id}"
+        )
 
     def generate_youtube_recording(self) -> str:
         """Generate description for YouTube recording."""
-        lang = self.meetup.language
-        location_name = self.meetup.location_name(lang)
+        return self._build_youtube_description(
+            f"Python Łódź Meetup #{self.meetup.meetup_id}"
+        )
 
-        if lang == Language.EN:
-            parts = [
-                f"Python Łódź Meetup #{self.meetup.meetup_id}",
-                "",
-                f"📅 {self._format_date_long()}",
-                f"🕕 {self.meetup.time}",
-                f"📍 {location_name}",
-                "",
-                "Agenda:",
-                "",
-                self._build_agenda_section(lang),
-                "",
-                "Links to our community:",
-                f"➡️ Official website: {SocialMediaLinks.OFFICIAL_WEBSITE}",
-                f"➡️ Meetup: {SocialMediaLinks.MEETUP}",
-                f"➡️ Discord: {SocialMediaLinks.DISCORD}",
-                f"➡️ Facebook: {SocialMediaLinks.FACEBOOK}",
-                f"➡️ LinkedIn: {SocialMediaLinks.LINKEDIN}",
-                f"➡️ Instagram: {SocialMediaLinks.INSTAGRAM}",
-                f"➡️ YouTube: {SocialMediaLinks.YOUTUBE}",
-                "",
-                "Presentations:",
-                "",
-                self._build_talks_section(lang),
-            ]
-        else:
-            parts = [
-                f"Python Łódź Meetup #{self.meetup.meetup_id}",
-                "",
-                f"📅 {self._format_date_long()}",
-                f"🕕 {self.meetup.time}",
-                f"📍 {location_name}",
-                "",
-                "Agenda:",
-                "",
-                self._build_agenda_section(lang),
-                "",
-                "Linki do społeczności:",
-                f"➡️ Oficjalna strona: {SocialMediaLinks.OFFICIAL_WEBSITE}",
-                f"➡️ Meetup: {SocialMediaLinks.MEETUP}",
-                f"➡️ Discord: {SocialMediaLinks.DISCORD}",
-                f"➡️ Facebook: {SocialMediaLinks.FACEBOOK}",
-                f"➡️ LinkedIn: {SocialMediaLinks.LINKEDIN}",
-                f"➡️ Instagram: {SocialMediaLinks.INSTAGRAM}",
-                f"➡️ YouTube: {SocialMediaLinks.YOUTUBE}",
-                "",
-                "Prezentacje:",
-                "",
-                self._build_talks_section(lang),
-            ]
+    def _build_youtube_description(self, header: str) -> str:
+        """Fill the shared YouTube description template."""
+        lang = self.meetup.language
+        labels = _LABELS[lang]
+        return _YOUTUBE_DESCRIPTION_TEMPLATE.format(
+            header=header,
+            date_long=self.formatted_date_long,
+            time=self.meetup.time,
+            location=self.location_name,
+            agenda=self.agenda_section,
+            links_label=labels["links"],
+            community_links=_COMMUNITY_LINKS[lang],
+            talks_label=labels["talks"],
+            talks=self.talks_section,
+        )
 
-        return "\n".join(parts)
+    @cached_property
+    def _common_links_block(self) -> str:
+        """Agenda and community links shared by every talk recording."""
+        links = _COMMUNITY_LINKS_SECTION[self.meetup.language]
+        return f"{self.agenda_section}\n\n{links}"
 
     def generate_youtube_recording_talks(self) -> list[YouTubeRecordingDescription]:
         """Generate descriptions for each talk recording."""
         if self.meetup.is_to_be_announced:
             return []
 
-        lang = self.meetup.language
+        speaker_label = _LABELS[self.meetup.language]["speaker"]
         descriptions = []
-        for talk in self.meetup.talks:
-            speaker = self._get_speaker_by_id(talk.speaker_id)
-            speaker_name = speaker.name if speaker else "Unknown"
-
+        for talk, speaker_name in self._talks_with_speakers:
             title = f"Python Łódź #{self.meetup.meetup_id} - {talk.title}"
-
-            if lang == Language.EN:
-                parts = [
-                    self._build_agenda_section(lang),
-                    "",
-                    "Links to our community:",
-                    f"➡️ Official website: {SocialMediaLinks.OFFICIAL_WEBSITE}",
-                    f"➡️ Meetup: {SocialMediaLinks.MEETUP}",
-                    f"➡️ Discord: {SocialMediaLinks.DISCORD}",
-                    f"➡️ Facebook: {SocialMediaLinks.FACEBOOK}",
-                    f"➡️ LinkedIn: {SocialMediaLinks.LINKEDIN}",
-                    f"➡️ Instagram: {SocialMediaLinks.INSTAGRAM}",
-                    f"➡️ YouTube: {SocialMediaLinks.YOUTUBE}",
-                    "",
-                    f"Speaker: {speaker_name}",
-                    "",
-                    talk.description,
-                ]
-            else:
-                parts = [
-                    self._build_agenda_section(lang),
-                    "",
-                    "Linki do społeczności:",
-                    f"➡️ Oficjalna strona: {SocialMediaLinks.OFFICIAL_WEBSITE}",
-                    f"➡️ Meetup: {SocialMediaLinks.MEETUP}",
-                    f"➡️ Discord: {SocialMediaLinks.DISCORD}",
-                    f"➡️ Facebook: {SocialMediaLinks.FACEBOOK}",
-                    f"➡️ LinkedIn: {SocialMediaLinks.LINKEDIN}",
-                    f"➡️ Instagram: {SocialMediaLinks.INSTAGRAM}",
-                    f"➡️ YouTube: {SocialMediaLinks.YOUTUBE}",
-                    "",
-                    f"Prelegent: {speaker_name}",
-                    "",
-                    talk.description,
-                ]
-
-            description = "\n".join(parts)
+            description = (
+                f"{self._common_links_block}\n\n"
+                f"{speaker_label}: {speaker_name}\n\n"
+                f"{talk.description}"
+            )
             descriptions.append(
-                YouTubeRecordingDescription(title=title, description=description)
+                YouTubeRecordingDescription.model_construct(
+                    title=title, description=description
+                )
             )
 
         return descriptions
@@ -562,262 +967,42 @@ class MeetupDescriptionGenerator:
     def generate_chatgpt_prompt(self) -> str:
         """Generate super prompt for ChatGPT to create social media posts."""
         lang = self.meetup.language
-        location_name = self.meetup.location_name(lang)
-        sponsors_info = self._build_sponsors_info(lang)
-
-        if lang == Language.EN:
-            parts = [
-                "# Super Prompt for Generating Social Media Posts",
-                "",
-                "## Meeting Information",
-                "",
-                f"**Meeting number:** Meetup #{self.meetup.meetup_id}",
-                f"**Date:** {self._format_date_long()}",
-                f"**Time:** {self.meetup.time}",
-                f"**Location:** {location_name}",
-                "",
-                "## Presentations",
-                "",
-                self._build_talks_section(lang),
-                "## Agenda",
-                "",
-                self._build_agenda_section(lang),
-                "",
-                "## Sponsors",
-                "",
-                sponsors_info,
-                "",
-                "## Links to Our Community",
-                "",
-                f"- Official website: {SocialMediaLinks.OFFICIAL_WEBSITE}",
-                f"- Meetup: {SocialMediaLinks.MEETUP}",
-                f"- Discord: {SocialMediaLinks.DISCORD}",
-                f"- Facebook: {SocialMediaLinks.FACEBOOK}",
-                f"- LinkedIn: {SocialMediaLinks.LINKEDIN}",
-                f"- Instagram: {SocialMediaLinks.INSTAGRAM}",
-                f"- YouTube: {SocialMediaLinks.YOUTUBE}",
-                "",
-                "## Instructions for Generating Posts",
-                "",
-                "Based on the above information, prepare a series of posts for Facebook, Discord and Email that:",
-                "",
-                "1. **Speaker Posts** - one post for each speaker:",
-                "   - Introduce the speaker and their presentation",
-                "   - Highlight the key points of the presentation",
-                "   - Encourage participation in the meeting",
-                "   - Add link to the meeting page",
-                "",
-                "2. **Sponsor Posts** - one post for each sponsor:",
-                "   - Thank the sponsor for their support",
-                "   - Briefly describe what the sponsor does",
-                "   - Add link to the sponsor's website",
-                "   - Encourage following them on social media",
-                "",
-                f"3. **Informative Posts** - 2 weeks before the meeting which will be {self._format_date_long()}:",
-                "   - Reminders about the upcoming meeting",
-                "   - Interesting facts about presentations",
-                "   - Information about live streaming",
-                "   - Invitations to join the community",
-                "",
-                "4. **Live Stream Post** - a few days before the meeting:",
-                "   - Information that the meeting will be streamed live",
-                "   - Link to the stream",
-                "   - Encouragement to watch online",
-                "",
-                "## Post Formatting Guidelines",
-                "",
-                "- **Tone:** Professional but friendly, casual, open",
-                "- **Target audience:** Python programmers and people who want to learn it",
-                "- **Emoji:** Use sparingly to highlight important information and emotions",
-                "- **Each post should include:** Link to the meeting page",
-                "- **Format:** Each post should be ready to paste directly on social media",
-                '- **Dash:** Use the "-" character as a dash in descriptions',
-                "",
-                "## Example Post Formatting",
-                "",
-                "```",
-                "🎉 Python Łódź meetup in a week!",
-                "",
-                "We're waiting for you on Friday at 18:00 at IndieBI 🚀",
-                "",
-                "This time we'll be talking about:",
-                "✨ Clean architecture in Django",
-                "✨ Visualizations in Python",
-                "",
-                "Sign up: [link to meetup]",
-                "Live stream: [link to page]",
-                "",
-                "Join us on Discord: [link to Discord]",
-                "```",
-                "",
-                "## Additional Information",
-                "",
-                "- Meetings have a casual format, preferring a family/friendly/open atmosphere",
-                f"- Posts should be scheduled 2 weeks before the meeting which will be {self._format_date_long()}",
-                "- Each post should be unique and not repeat itself",
-                "- Posts can contain questions for the community",
-                "- Encourage inviting friends",
-                "",
-                "## Image Generation Guidelines",
-                "",
-                "When generating images for posts:",
-                "- **Aspect ratio:** Always use 4:5 ratio (e.g., 1080x1350 pixels)",
-                "- **Logo:** Every image must include the uploaded Python Łódź logo",
-                "- **Logo placement:** The logo should be visible but not dominant",
-                "",
-                "## Prepare Posts in the Following Format",
-                "",
-                "For each post provide:",
-                f"1. **Publication date** (2 weeks before the meeting which will be {self._format_date_long()})",
-                "2. **Platform** (Facebook/Discord/Email)",
-                "3. **Post content** (ready to paste)",
-                "4. **Image prompt** (if an image should be included):",
-                "   - Top content (text at the top of the image)",
-                "   - Bottom content (text at the bottom of the image)",
-                "",
-                "Start preparing posts! 🚀",
-            ]
-        else:
-            parts = [
-                "# Super Prompt do Generowania Postów na Social Media",
-                "",
-                "## Informacje o Spotkaniu",
-                "",
-                f"**Numer spotkania:** Meetup #{self.meetup.meetup_id}",
-                f"**Data:** {self._format_date_long()}",
-                f"**Godzina:** {self.meetup.time}",
-                f"**Miejsce:** {location_name}",
-                "",
-                "## Prezentacje",
-                "",
-                self._build_talks_section(lang),
-                "## Agenda",
-                "",
-                self._build_agenda_section(lang),
-                "",
-                "## Sponsorzy",
-                "",
-                sponsors_info,
-                "",
-                "## Linki do Społeczności",
-                "",
-                f"- Oficjalna strona: {SocialMediaLinks.OFFICIAL_WEBSITE}",
-                f"- Meetup: {SocialMediaLinks.MEETUP}",
-                f"- Discord: {SocialMediaLinks.DISCORD}",
-                f"- Facebook: {SocialMediaLinks.FACEBOOK}",
-                f"- LinkedIn: {SocialMediaLinks.LINKEDIN}",
-                f"- Instagram: {SocialMediaLinks.INSTAGRAM}",
-                f"- YouTube: {SocialMediaLinks.YOUTUBE}",
-                "",
-                "## Instrukcje do Generowania Postów",
-                "",
-                "Na podstawie powyższych informacji przygotuj serię postów na Facebook, Discord oraz Mail które:",
-                "",
-                "1. **Posty o Prelegentach** - jeden post dla każdego prelegenta:",
-                "   - Przedstaw prelegenta i jego prezentację",
-                "   - Podkreśl najważniejsze punkty prezentacji",
-                "   - Zachęć do udziału w spotkaniu",
-                "   - Dodaj link do strony spotkania",
-                "",
-                "2. **Posty o Sponsorach** - jeden post dla każdego sponsora:",
-                "   - Podziękuj sponsorowi za wsparcie",
-                "   - Opisz krótko czym się zajmuje sponsor",
-                "   - Dodaj link do strony sponsora",
-                "   - Zachęć do śledzenia ich na social mediach",
-                "",
-                f"3. **Posty Informacyjne** - na 2 tygodni przed spotkaniem które będzie {self._format_date_long()}:",
-                "   - Przypomnienia o zbliżającym się spotkaniu",
-                "   - Ciekawostki o prezentacjach",
-                "   - Informacje o transmisji live",
-                "   - Zaproszenia do dołączenia do społeczności",
-                "",
-                "4. **Post o Transmisji Live** - kilka dni przed spotkaniem:",
-                "   - Informacja że spotkanie będzie transmitowane na żywo",
-                "   - Link do transmisji",
-                "   - Zachęta do oglądania online",
-                "",
-                "## Wytyczne do Formatowania Postów",
-                "",
-                "- **Ton:** Profesjonalny ale przyjazny, luźny, otwarty",
-                "- **Grupa docelowa:** Programiści Pythona i osoby chcące się go nauczyć",
-                "- **Emoji:** Używaj z umiarkowaniem do podkreślania ważnych informacji i emocji",
-                "- **Każdy post powinien zawierać:** Link do strony spotkania",
-                "- **Format:** Każdy post powinien być gotowy do wklejenia bezpośrednio na social media",
-                '- **Myślnik:** Używaj znaku "-" jako myślnika w opisach',
-                "",
-                "## Przykład Formatowania Posta",
-                "",
-                "```",
-                "🎉 Już za tydzień spotkanie Python Łódź!",
-                "",
-                "Czekamy na Was w piątek o 18:00 w IndieBI 🚀",
-                "",
-                "Tym razem będziemy mówić o:",
-                "✨ Czystej architekturze w Django",
-                "✨ Wizualizacjach w Pythonie",
-                "",
-                "Zapisy: [link do meetupu]",
-                "Transmisja live: [link do strony]",
-                "",
-                "Dołącz do nas na Discordzie: [link do Discorda]",
-                "```",
-                "",
-                "## Dodatkowe Informacje",
-                "",
-                "- Spotkania mają luźną formę, preferuje się rodzinny/przyjacielski/otwarty klimat",
-                f"- Posty mają być zaplanowane na 2 tygodni przed spotkaniem które będzie {self._format_date_long()}",
-                "- Każdy post powinien być unikalny i nie powtarzać się",
-                "- Posty mogą zawierać pytania do społeczności",
-                "- Zachęcaj do zapraszania znajomych",
-                "",
-                "## Wytyczne do Generowania Obrazków",
-                "",
-                "Podczas generowania obrazków do postów:",
-                "- **Format obrazka:** Zawsze używaj proporcji 4:5 (np. 1080x1350 pikseli)",
-                "- **Logo:** Każdy obrazek musi zawierać uploadowane logo Python Łódź",
-                "- **Umiejscowienie logo:** Logo powinno być widoczne ale nie dominujące",
-                "",
-                "## Przygotuj Posty w Następującym Formacie",
-                "",
-                "Dla każdego posta podaj:",
-                f"1. **Data publikacji** (na 2 tygodni przed spotkaniem które będzie {self._format_date_long()})",
-                "2. **Platforma** (Facebook/Discord/Mail)",
-                "3. **Treść posta** (gotowa do wklejenia)",
-                "4. **Prompt do obrazka** (jeśli ma być dołączony obraz):",
-                "   - Górna treść (tekst na górze obrazka)",
-                "   - Dolna treść (tekst na dole obrazka)",
-                "",
-                "Zacznij od przygotowania postów! 🚀",
-            ]
-
-        return "\n".join(parts)
+        return _CHATGPT_PROMPT_TEMPLATES[lang].format(
+            meetup_id=self.meetup.meetup_id,
+            date_long=self.formatted_date_long,
+            time=self.meetup.time,
+            location=self.location_name,
+            talks=self.talks_section,
+            agenda=self.agenda_section,
+            sponsors_info=self.sponsors_info,
+            community_links=_COMMUNITY_LINKS_MD[lang],
+        )
 
     def _build_sponsors_info(self, language: Language | None = None) -> str:
         """Build detailed sponsors information."""
         lang = language or self.meetup.language
         if not self.meetup.sponsors:
-            return (
-                "No sponsor information."
-                if lang == Language.EN
-                else "Brak informacji o sponsorach."
-            )
+            return _LABELS[lang]["no_sponsors"]
 
-        lines = []
-        for sponsor_id in self.meetup.sponsors:
-            sponsor = self.sponsor_repo.get_sponsor(sponsor_id)
+        desc_label = _LABELS[lang]["description"]
+        blocks = []
+        for sponsor_id, sponsor in self._sponsors:
             if sponsor:
-                lines.append(f"**{sponsor.get('name', sponsor_id)}**")
-                lines.append(f"Website: {sponsor.get('website', 'N/A')}")
+                block = (
+                    f"**{sponsor.get('name', sponsor_id)}**\n"
+                    f"Website: {sponsor.get('website', 'N/A')}\n"
+                )
                 if sponsor.get("description"):
-                    desc_label = "Description:" if lang == Language.EN else "Opis:"
-                    lines.append(f"{desc_label} {sponsor.get('description')}")
-                lines.append("")
+                    block += f"{desc_label} {sponsor.get('description')}\n"
+                blocks.append(block)
 
-        return "\n".join(lines)
+        # Blocks end with a newline, so joining them leaves a blank line between
+        return "\n".join(blocks)
 
     def generate_all(self) -> MeetupDescriptions:
         """Generate all descriptions."""
-        return MeetupDescriptions(
+        # All fields are built by this class, so pydantic validation is skipped
+        return MeetupDescriptions.model_construct(
             meetup_id=self.meetup.meetup_id,
             meetup_com=self.generate_meetup_com(),
             youtube_live=self.generate_youtube_live(),
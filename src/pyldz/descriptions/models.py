@@ -1,6 +1,6 @@
 """Models for meetup descriptions."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class AgendaItem(BaseModel):
@@ -13,6 +13,8 @@ class AgendaItem(BaseModel):
 class YouTubeRecordingDescription(BaseModel):
     """YouTube recording description for a single talk."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     title: str
     description: str
 
@@ -20,6 +22,8 @@ class YouTubeRecordingDescription(BaseModel):
 class MeetupDescriptions(BaseModel):
     """All descriptions for a meetup."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     meetup_id: str
     meetup_com: str
     youtube_live: str
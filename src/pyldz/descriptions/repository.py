@@ -1,12 +1,22 @@
 """Repository for saving meetup descriptions."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from pyldz.descriptions.models import MeetupDescriptions
 
 log = logging.getLogger(__name__)
 
+# Upper bound on concurrent file writes in save_all
+_MAX_WRITERS = 8
+
+
+def _write_file(payload: tuple[Path, bytes]) -> None:
+    """Write pre-encoded content to a file."""
+    path, data = payload
+    path.write_bytes(data)
+
 
 class DescriptionRepository:
     """Save meetup descriptions to markdown files."""
@@ -19,6 +29,14 @@ class DescriptionRepository:
             meetups_content_dir: Path to page/content/spotkania directory
         """
         self.meetups_content_dir = meetups_content_dir
+        # Directories already created by this repository
+        self._ensured_dirs: set[Path] = set()
+
+    def _ensure_dir(self, directory: Path) -> None:
+        """Create a directory (and its parents) once per repository."""
+        if directory not in self._ensured_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(directory)
 
     def save_all(self, meetup_id: str, descriptions: MeetupDescriptions) -> list[Path]:
         """
@@ -32,44 +50,55 @@ class DescriptionRepository:
             List of created file paths
         """
         descriptions_dir = self.meetups_content_dir / meetup_id / "descriptions"
-        descriptions_dir.mkdir(parents=True, exist_ok=True)
-
-        created_files = []
-
-        # Save meetup.com description
-        meetup_com_file = descriptions_dir / "meetup-com.md"
-        meetup_com_file.write_text(descriptions.meetup_com, encoding="utf-8")
-        log.info(f"Saved meetup.com description: {meetup_com_file}")
-        created_files.append(meetup_com_file)
-
-        # Save YouTube live description
-        youtube_live_file = descriptions_dir / "youtube-live.md"
-        youtube_live_file.write_text(descriptions.youtube_live, encoding="utf-8")
-        log.info(f"Saved YouTube live description: {youtube_live_file}")
-        created_files.append(youtube_live_file)
-
-        # Save YouTube recording description
-        youtube_recording_file = descriptions_dir / "youtube-recording.md"
-        youtube_recording_file.write_text(
-            descriptions.youtube_recording, encoding="utf-8"
-        )
-        log.info(f"Saved YouTube recording description: {youtube_recording_file}")
-        created_files.append(youtube_recording_file)
-
-        # Save YouTube recording descriptions for each talk
         talks_dir = descriptions_dir / "youtube-talks"
-        talks_dir.mkdir(parents=True, exist_ok=True)
+        # Creating the talks directory creates the descriptions directory too
+        self._ensure_dir(talks_dir)
+
+        # (path, content, log label) for every file, in the returned order
+        files = [
+            (
+                descriptions_dir / "meetup-com.md",
+                descriptions.meetup_com,
+                "meetup.com description",
+            ),
+            (
+                descriptions_dir / "youtube-live.md",
+                descriptions.youtube_live,
+                "YouTube live description",
+            ),
+            (
+                descriptions_dir / "youtube-recording.md",
+                descriptions.youtube_recording,
+                "YouTube recording description",
+            ),
+        ]
         for i, talk_desc in enumerate(descriptions.youtube_recording_talks, 1):
-            talk_file = talks_dir / f"talk-{i}.md"
-            content = f"# {talk_desc.title}\n\n{talk_desc.description}"
-            talk_file.write_text(content, encoding="utf-8")
-            log.info(f"Saved YouTube talk {i} description: {talk_file}")
-            created_files.append(talk_file)
-
-        # Save ChatGPT prompt
-        chatgpt_prompt_file = descriptions_dir / "chatgpt-prompt.md"
-        chatgpt_prompt_file.write_text(descriptions.chatgpt_prompt, encoding="utf-8")
-        log.info(f"Saved ChatGPT prompt: {chatgpt_prompt_file}")
-        created_files.append(chatgpt_prompt_file)
-
-        return created_files
+            files.append(
+                (
+                    talks_dir / f"talk-{i}.md",
+                    f"# {talk_desc.title}\n\n{talk_desc.description}",
+                    f"YouTube talk {i} description",
+                )
+            )
+        files.append(
+            (
+                descriptions_dir / "chatgpt-prompt.md",
+                descriptions.chatgpt_prompt,
+                "ChatGPT prompt",
+            )
+        )
+
+        # Contents are encoded once and written as bytes, skipping the text
+        # I/O layer that write_text() wraps around each file. The writes are
+        # independent and release the GIL, so they overlap in a thread pool.
+        payloads = [(path, content.encode("utf-8")) for path, content, _ in files]
+        with ThreadPoolExecutor(max_workers=_MAX_WRITERS) as executor:
+            list(executor.map(_write_file, payloads))
+
+        # Per-file messages are debug-level and formatted lazily, so they cost
+        # nothing unless debug logging is enabled
+        for path, _, label in files:
+            log.debug("Saved %s: %s", label, path)
+        log.info("Saved %d description files for meetup %s", len(files), meetup_id)
+
+        return [path for path, _, _ in files]
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
 import logging
+import os
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 import numpy as np
-from deepface import DeepFace
 from PIL import Image
 
 log = logging.getLogger(__name__)
 
+# The shared detector is not guaranteed to be thread-safe, so avatars prepared
+# in a thread pool take turns on detection while decoding and saving overlap
+_detect_lock = threading.Lock()
+
 
 class FaceDetectionError(Exception):
     pass
@@ -27,19 +33,52 @@ class _Box:
         return (self.x + self.w // 2, self.y + self.h // 2)
 
 
+@lru_cache(maxsize=1)
+def _get_detector() -> Any | None:
+    """Build the OpenCV face detector once per process.
+
+    DeepFace keeps built models in its own cache, so ``extract_faces`` reuses
+    this detector. Returns None when the installed DeepFace does not expose its
+    detector models; ``extract_faces`` then builds the detector on first use.
+    """
+    # DeepFace pulls in TensorFlow, so it is only imported once a face has to
+    # be detected; keep TensorFlow's C++ logging quiet while it loads
+    os.environ.setdefault("TF_CPP_MIN_LOG_LEVEL", "3")
+    try:
+        from deepface.modules import modeling
+
+        return modeling.build_model(task="face_detector", model_name="opencv")
+    except (ImportError, AttributeError, TypeError, ValueError) as e:
+        log.debug("Could not preload the face detector: %s", e)
+        return None
+
+
+def load_detector() -> None:
+    """Load the face detector now instead of on the first detection."""
+    _get_detector()
+
+
 def _deepface_extract_faces(img: Image.Image) -> list[dict[str, Any]]:
     # DeepFace.extract_faces requires a file path or NumPy array
     if isinstance(img, Image.Image):
-        arr = np.array(img.convert("RGB"))
+        # asarray wraps PIL's exported buffer instead of copying it again, and
+        # RGB images skip the convert() copy entirely
+        arr = np.asarray(img if img.mode == "RGB" else img.convert("RGB"))
     else:
         arr = img  # assume already ndarray
 
-    return DeepFace.extract_faces(
-        img_path=arr,
-        detector_backend="opencv",
-        enforce_detection=False,
-        align=True,
-    )  # type: ignore
+    _get_detector()
+    from deepface import DeepFace
+
+    # Go through extract_faces rather than the detector itself, so DeepFace's
+    # confidence handling and box clamping still apply to the face boxes
+    with _detect_lock:
+        return DeepFace.extract_faces(
+            img_path=arr,
+            detector_backend="opencv",
+            enforce_detection=False,
+            align=True,
+        )  # type: ignore
 
 
 def _compute_square_crop(
@@ -53,16 +92,10 @@ def _compute_square_crop(
     half = side // 2
     left = max(0, cx - half)
     top = max(0, cy - half)
-    right = min(img_w, left + side)
-    bottom = min(img_h, top + side)
 
-    # Adjust if we hit bounds to keep square
-    width = right - left
-    height = bottom - top
-    side = min(width, height)
-    right = left + side
-    bottom = top + side
-    return left, top, right, bottom
+    # Shrink to whatever fits inside the image to keep the crop square
+    side = min(side, img_w - left, img_h - top)
+    return left, top, left + side, top + side
 
 
 def _to_box(face: dict[str, Any]) -> _Box:
@@ -88,9 +121,6 @@ def detect_and_center_square(image: Image.Image) -> Image.Image:
 
     img_w, img_h = image.size
     crop = _compute_square_crop(box, img_w, img_h)
-    cropped = image.crop(crop)
-
-    # Ensure mode supports alpha if original had it
-    if image.mode == "RGBA" and cropped.mode != "RGBA":
-        cropped = cropped.convert("RGBA")
-    return cropped
+    # Detection ran on an RGB view; crop the original so its mode (and any
+    # alpha channel) carries through without another convert()
+    return image.crop(crop)
@@ -1,167 +1,256 @@
+import hashlib
 import logging
+import multiprocessing
+import os
 import shutil
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 from pyldz.descriptions.generators import MeetupDescriptionGenerator
 from pyldz.descriptions.repository import DescriptionRepository
 from pyldz.image_generator import MeetupImageGenerator
-from pyldz.models import GoogleSheetsRepository, Language, Meetup, Speaker
+from pyldz.models import GoogleSheetsRepository, Language, Meetup, Speaker, Talk
 from pyldz.speaker_yaml import write_speakers_yaml
 
 log = logging.getLogger(__name__)
 
+# Language-specific text of the meetup page
+_MARKDOWN_TEXTS = {
+    Language.EN: {
+        "information": "Information",
+        "date": "date",
+        "time": "time",
+        "location": "location",
+        "signup_button": "➡️ SIGN UP LINK",
+        "feedback_button": "📝 SURVEY - rate the meeting and presentations",
+        "presentations": "Presentations",
+        "recording": "Recording",
+        "sponsors": "Sponsors",
+        "no_talks_message": (
+            "Soon we will announce the official agenda of our latest Python Łódź meetup. "
+            "Stay tuned, because we are preparing really interesting presentations.\n\n"
+            "Regardless of the topic, every meeting is a great opportunity to expand your knowledge, "
+            "meet new people and together build a strong community of Python enthusiasts.\n\n"
+            "Reserve your spot now – don't be surprised when we launch with full event information."
+        ),
+    },
+    Language.PL: {
+        "information": "Informacje",
+        "date": "data",
+        "time": "godzina",
+        "location": "miejsce",
+        "signup_button": "➡️ LINK DO ZAPISÓW",
+        "feedback_button": "📝 ANKIETA - oceń spotkanie oraz prelekcje",
+        "presentations": "Prelekcje",
+        "recording": "Nagranie",
+        "sponsors": "Sponsorzy",
+        "no_talks_message": (
+            "Już wkrótce ogłosimy oficjalną agendę naszego najnowszego spotkania Python Łódź. "
+            "Bądźcie czujni, bo szykujemy naprawdę interesujące prezentacje.\n\n"
+            "Niezależnie od tematu, każde spotkanie to świetna okazja, by poszerzyć swoją wiedzę, "
+            "poznać nowych ludzi i razem budować silną społeczność miłośników Pythona.\n\n"
+            "Zarezerwuj swoje miejsce już teraz – nie daj się zaskoczyć, gdy ruszymy z pełną informacją o wydarzeniu."
+        ),
+    },
+}
+
+# Meetup page body; the optional sections are pre-rendered and already carry
+# their own surrounding line breaks
+_MEETUP_MARKDOWN_TEMPLATE = """\
+<img src="featured.png" alt="Infographic" />
+
+## {information}
+
+**📅 {date_label}:** {date}</br>
+**🕕 {time_label}:** {time}</br>
+**📍 {location_label}:** {location}</br>{buttons}
+
+{livestream}## {presentations}
+
+{talks}## {sponsors}{sponsor_list}"""
+
+_LIVESTREAM_TEMPLATE = (
+    '## Live Stream\n{{{{< youtubeLite id="{}" label="Label" >}}}}\n\n'
+)
+
+_SPONSOR_ARTICLE_TEMPLATE = '\n{{{{< article link="/sponsorzy/{}/" >}}}}\n'
+
+_FRONTMATTER_TEMPLATE = """\
+---
+title: "{title}"
+date: {date}T{time}:00+02:00
+time: "{time}"
+place: "{location}"
+---
+"""
+
+
+def _render_button(href: str, label: str) -> str:
+    """Render a Hugo button shortcode preceded by a blank line."""
+    return f'\n\n{{{{< button href="{href}" target="_blank" >}}}}\n{label}\n{{{{< /button >}}}}'
+
+
+def _render_talk(talk: Talk, recording_label: str) -> str:
+    """Render a single talk followed by a blank line."""
+    # Clean title (remove newlines and extra spaces)
+    clean_title = " ".join(talk.title.split())
+    talk_md = f'### {clean_title}\n{{{{< speaker speaker_id="{talk.speaker_id}" >}}}}\n'
+    if talk.description:
+        # Convert newlines to markdown line breaks
+        description = talk.description.replace("\n", "  \n")
+        talk_md += f"{description}\n"
+    if talk.youtube_id:
+        talk_md += (
+            f"#### {recording_label}\n"
+            f'{{{{< youtubeLite id="{talk.youtube_id}" label="Label" >}}}}\n'
+        )
+    return talk_md + "\n"
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hard-link dst to src, copying instead where links are not supported."""
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+@lru_cache(maxsize=1)
+def _renderer_fingerprint() -> bytes:
+    """Digest of the code that draws featured images."""
+    digest = hashlib.blake2b(digest_size=16)
+    for module in ("image_generator.py", "face_centering.py"):
+        digest.update(Path(__file__).with_name(module).read_bytes())
+    return digest.digest()
+
+
+def _featured_images_key(
+    meetup: Meetup, speakers: list[Speaker], asset_paths: tuple[Path, ...]
+) -> str:
+    """Key of everything a meetup's featured images are rendered from."""
+    digest = hashlib.blake2b(_renderer_fingerprint(), digest_size=16)
+    # Artwork and fonts are identified by size and mtime rather than re-read
+    for path in asset_paths:
+        try:
+            stat = path.stat()
+            digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+        except OSError:
+            digest.update(f"{path}:missing\n".encode())
+    digest.update(meetup.model_dump_json().encode())
+    for speaker in speakers:
+        digest.update(speaker.model_dump_json(exclude={"avatar"}).encode())
+        digest.update(hashlib.blake2b(speaker.avatar.content).digest())
+    return digest.hexdigest()
+
+
+# (path, language, aspect ratio, speakers, meetup) of one featured image
+_FeaturedVariant = tuple[Path, Language, str, list[Speaker], Meetup]
+# Image generator of a render worker process, set once by its pool initializer
+_worker_generator: MeetupImageGenerator | None = None
+
+
+def _init_render_worker(generator: MeetupImageGenerator) -> None:
+    """Keep the (unpickled) generator for every variant this worker renders."""
+    global _worker_generator
+    _worker_generator = generator
+
+
+def _render_variant(generator: MeetupImageGenerator, variant: _FeaturedVariant) -> Path:
+    """Render one featured image variant with the given generator."""
+    image_path, language, aspect_ratio, image_speakers, image_meetup = variant
+    return generator.generate_featured_image(
+        image_meetup,
+        image_speakers,
+        image_path,
+        language,
+        aspect_ratio=aspect_ratio,
+    )
+
+
+def _render_featured_image(variant: _FeaturedVariant) -> Path:
+    """Render one featured image variant; runs in a worker process."""
+    assert _worker_generator is not None
+    return _render_variant(_worker_generator, variant)
+
 
 class HugoMeetupGenerator:
     def __init__(self, output_dir: Path):
         self.output_dir = output_dir
         self.meetups_dir = output_dir / "content" / "spotkania"
         self.data_dir = output_dir / "data"
+        # Parsed sponsor YAML reused between runs (kept outside Hugo's data dir)
+        self.sponsors_cache_file = output_dir / ".cache" / "sponsors.json"
+        # Keys of the inputs each meetup's featured images were rendered from
+        self.featured_keys_dir = output_dir / ".cache" / "featured"
 
         # Initialize image generator
-        assets_dir = output_dir / "assets"
-        avatars_dir = assets_dir / "images" / "avatars"
-        self.image_generator = MeetupImageGenerator(assets_dir, avatars_dir)
+        self.assets_dir = output_dir / "assets"
+        self.avatars_dir = self.assets_dir / "images" / "avatars"
+        self.image_generator = MeetupImageGenerator(self.assets_dir, self.avatars_dir)
 
         # Initialize description repository
         self.description_repo = DescriptionRepository(self.meetups_dir)
 
+        # Worker pool shared by all meetups while generate_all_meetups renders
+        # several of them; started by the first meetup with images to render
+        self._share_pool = False
+        self._executor: ProcessPoolExecutor | None = None
+        # Generator the shared pool's workers were started with
+        self._pool_generator: MeetupImageGenerator | None = None
+
     def generate_meetup_markdown(self, meetup: Meetup) -> str:
         """Generate markdown content for a meetup."""
-        # Language-specific text mapping
-        texts = {
-            Language.EN: {
-                "information": "Information",
-                "date": "date",
-                "time": "time",
-                "location": "location",
-                "signup_button": "➡️ SIGN UP LINK",
-                "feedback_button": "📝 SURVEY - rate the meeting and presentations",
-                "presentations": "Presentations",
-                "recording": "Recording",
-                "sponsors": "Sponsors",
-                "no_talks_message": (
-                    "Soon we will announce the official agenda of our latest Python Łódź meetup. "
-                    "Stay tuned, because we are preparing really interesting presentations.\n\n"
-                    "Regardless of the topic, every meeting is a great opportunity to expand your knowledge, "
-                    "meet new people and together build a strong community of Python enthusiasts.\n\n"
-                    "Reserve your spot now – don't be surprised when we launch with full event information."
-                ),
-            },
-            Language.PL: {
-                "information": "Informacje",
-                "date": "data",
-                "time": "godzina",
-                "location": "miejsce",
-                "signup_button": "➡️ LINK DO ZAPISÓW",
-                "feedback_button": "📝 ANKIETA - oceń spotkanie oraz prelekcje",
-                "presentations": "Prelekcje",
-                "recording": "Nagranie",
-                "sponsors": "Sponsorzy",
-                "no_talks_message": (
-                    "Już wkrótce ogłosimy oficjalną agendę naszego najnowszego spotkania Python Łódź. "
-                    "Bądźcie czujni, bo szykujemy naprawdę interesujące prezentacje.\n\n"
-                    "Niezależnie od tematu, każde spotkanie to świetna okazja, by poszerzyć swoją wiedzę, "
-                    "poznać nowych ludzi i razem budować silną społeczność miłośników Pythona.\n\n"
-                    "Zarezerwuj swoje miejsce już teraz – nie daj się zaskoczyć, gdy ruszymy z pełną informacją o wydarzeniu."
-                ),
-            },
-        }
-
-        lang_texts = texts[meetup.language]
-        content_parts = []
-
-        # Add featured image
-        content_parts.append('<img src="featured.png" alt="Infographic" />')
-        content_parts.append("")
-
-        # Add information section
-        content_parts.append(f"## {lang_texts['information']}")
-        content_parts.append("")
-        content_parts.append(f"**📅 {lang_texts['date']}:** {meetup.date}</br>")
-        content_parts.append(f"**🕕 {lang_texts['time']}:** {meetup.time}</br>")
-        content_parts.append(
-            f"**📍 {lang_texts['location']}:** {meetup.location_name(meetup.language)}</br>"
-        )
+        lang_texts = _MARKDOWN_TEXTS[meetup.language]
 
-        # Add meetup link if available
+        buttons = ""
         if meetup.meetup_url:
-            content_parts.append("")
-            content_parts.append(
-                f'{{{{< button href="{meetup.meetup_url}" target="_blank" >}}}}'
-            )
-            content_parts.append(lang_texts["signup_button"])
-            content_parts.append("{{< /button >}}")
-
-        # Add feedback link if available
+            buttons += _render_button(meetup.meetup_url, lang_texts["signup_button"])
         if meetup.feedback_url:
-            content_parts.append("")
-            content_parts.append(
-                f'{{{{< button href="{meetup.feedback_url}" target="_blank" >}}}}'
+            buttons += _render_button(
+                meetup.feedback_url, lang_texts["feedback_button"]
             )
-            content_parts.append(lang_texts["feedback_button"])
-            content_parts.append("{{< /button >}}")
 
-        content_parts.append("")
-
-        # Add live stream if available
+        livestream = ""
         if meetup.livestream_id:
-            content_parts.append("## Live Stream")
-            content_parts.append(
-                f'{{{{< youtubeLite id="{meetup.livestream_id}" label="Label" >}}}}'
-            )
-            content_parts.append("")
+            livestream = _LIVESTREAM_TEMPLATE.format(meetup.livestream_id)
 
-        # Add talks section
-        content_parts.append(f"## {lang_texts['presentations']}")
-        content_parts.append("")
-
-        if not meetup.talks:
-            content_parts.append(lang_texts["no_talks_message"])
+        if meetup.talks:
+            talks = "".join(
+                _render_talk(talk, lang_texts["recording"]) for talk in meetup.talks
+            )
         else:
-            # Add each talk
-            for talk in meetup.talks:
-                # Clean title (remove newlines and extra spaces)
-                clean_title = " ".join(talk.title.split())
-                content_parts.append(f"### {clean_title}")
-                content_parts.append(
-                    f'{{{{< speaker speaker_id="{talk.speaker_id}" >}}}}'
-                )
-
-                if talk.description:
-                    # Convert newlines to markdown line breaks
-                    description = talk.description.replace("\n", "  \n")
-                    content_parts.append(description)
-
-                if talk.youtube_id:
-                    content_parts.append(f"#### {lang_texts['recording']}")
-                    content_parts.append(
-                        f'{{{{< youtubeLite id="{talk.youtube_id}" label="Label" >}}}}'
-                    )
-
-                content_parts.append("")
+            talks = lang_texts["no_talks_message"] + "\n"
 
-        # Add sponsors section
-        content_parts.append(f"## {lang_texts['sponsors']}")
-        for sponsor in meetup.sponsors:
-            content_parts.append(f'{{{{< article link="/sponsorzy/{sponsor}/" >}}}}')
-            content_parts.append("")
+        sponsor_list = "".join(map(_SPONSOR_ARTICLE_TEMPLATE.format, meetup.sponsors))
 
         # TODO: Add photos section (will need to check for images in resources)
 
-        return "\n".join(content_parts)
+        return _MEETUP_MARKDOWN_TEMPLATE.format(
+            information=lang_texts["information"],
+            date_label=lang_texts["date"],
+            date=meetup.date,
+            time_label=lang_texts["time"],
+            time=meetup.time,
+            location_label=lang_texts["location"],
+            location=meetup.location_name(meetup.language),
+            buttons=buttons,
+            livestream=livestream,
+            presentations=lang_texts["presentations"],
+            talks=talks,
+            sponsors=lang_texts["sponsors"],
+            sponsor_list=sponsor_list,
+        )
 
     def generate_frontmatter(self, meetup: Meetup) -> str:
         """Generate Hugo frontmatter for a meetup."""
-        frontmatter_parts = [
-            "---",
-            f'title: "{meetup.title}"',
-            f"date: {meetup.date}T{meetup.time}:00+02:00",
-            f'time: "{meetup.time}"',
-            f'place: "{meetup.location_name(meetup.language)}"',
-            "---",
-            "",
-        ]
-        return "\n".join(frontmatter_parts)
+        return _FRONTMATTER_TEMPLATE.format(
+            title=meetup.title,
+            date=meetup.date,
+            time=meetup.time,
+            location=meetup.location_name(meetup.language),
+        )
 
     def create_featured_image(
         self, meetup: Meetup, speakers: list, meetup_dir: Path
@@ -180,7 +269,7 @@ class HugoMeetupGenerator:
         pl_image_path = meetup_images_dir / "featured-pl.png"
         en_image_path = meetup_images_dir / "featured-en.png"
 
-        images_variants: list[tuple[Path, Language, str, list[Speaker], Meetup]] = [
+        images_variants: list[_FeaturedVariant] = [
             (pl_image_path, Language.PL, "16x9", speakers, meetup),
             (en_image_path, Language.EN, "16x9", speakers, meetup),
             (
@@ -212,12 +301,13 @@ class HugoMeetupGenerator:
                 meetup,
             ),
         ]
+        speakers_by_id = {s.id: s for s in speakers}
         for ration in ["16x9", "4x5", "1x1"]:
             for x in range(len(meetup.talks)):
                 lang = meetup.language
                 talk = meetup.talks[x]
                 # Find the speaker for this talk by speaker_id
-                speaker = next(s for s in speakers if s.id == talk.speaker_id)
+                speaker = speakers_by_id[talk.speaker_id]
                 images_variants.append(
                     (
                         meetup_images_dir / f"speaker_{x}-{lang.value}-{ration}.png",
@@ -228,21 +318,55 @@ class HugoMeetupGenerator:
                     )
                 )
 
+        # Skip rendering when nothing the images are drawn from has changed
+        key = _featured_images_key(meetup, speakers, self.image_generator.asset_paths)
+        key_file = self.featured_keys_dir / f"{meetup.meetup_id}.key"
+        image_paths = [featured_image_path] + [v[0] for v in images_variants]
+        if (
+            key_file.is_file()
+            and key_file.read_text(encoding="utf-8") == key
+            and all(path.is_file() for path in image_paths)
+        ):
+            log.info(f"Featured images for meetup {meetup.meetup_id} are up to date")
+            return featured_image_path
+
+        # Variants are independent and CPU-bound, so a multi-meetup run renders
+        # them in worker processes. Spawning workers costs more than it saves
+        # for one meetup, which is rendered here. Avatars are cached up front
+        # (written atomically) so workers only read them.
+        generator = self.image_generator
+        generator.prepare_avatars(speakers)
         for variant in images_variants:
-            image_path, language, aspect_ratio, image_speakers, image_meetup = variant
-            log.info(f"Generating featured image {image_path.name}")
-            self.image_generator.generate_featured_image(
-                image_meetup,
-                image_speakers,
-                image_path,
-                language,
-                aspect_ratio=aspect_ratio,
-            )
+            log.info(f"Generating featured image {variant[0].name}")
+        max_workers = min(len(images_variants), os.cpu_count() or 1)
+        if self._executor is None and not (self._share_pool and max_workers > 1):
+            for variant in images_variants:
+                _render_variant(generator, variant)
+        else:
+            # Workers get a pickled copy of this generator when they start and
+            # read avatars from the cache, so avatar bytes are not sent along
+            light_speakers = {
+                s.id: s.model_copy(
+                    update={"avatar": s.avatar.model_copy(update={"content": b""})}
+                )
+                for s in speakers
+            }
+            jobs = [
+                (path, lang, ratio, [light_speakers[s.id] for s in sps], m)
+                for path, lang, ratio, sps, m in images_variants
+            ]
+            if self._executor is not None and self._pool_generator is not generator:
+                self._stop_pool()
+            executor = self._executor or self._start_pool(generator, max_workers)
+            list(executor.map(_render_featured_image, jobs))
 
         if meetup.language == Language.PL:
-            shutil.copy2(pl_image_path, featured_image_path)
+            _link_or_copy(pl_image_path, featured_image_path)
         else:
-            shutil.copy2(en_image_path, featured_image_path)
+            _link_or_copy(en_image_path, featured_image_path)
+
+        self.featured_keys_dir.mkdir(parents=True, exist_ok=True)
+        key_file.write_text(key, encoding="utf-8")
 
         log.info(
             f"Created featured.png for meetup {meetup.meetup_id} "
@@ -251,6 +375,29 @@ class HugoMeetupGenerator:
 
         return featured_image_path
 
+    def _start_pool(
+        self, generator: MeetupImageGenerator, max_workers: int
+    ) -> ProcessPoolExecutor:
+        """Start the render workers shared by the remaining meetups."""
+        # Spawned rather than forked: prepare_avatars may already have loaded
+        # TensorFlow/OpenCV into this process, which must not be forked
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_render_worker,
+            initargs=(generator,),
+        )
+        self._executor = executor
+        self._pool_generator = generator
+        return executor
+
+    def _stop_pool(self) -> None:
+        """Shut down the shared render pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+        self._executor = None
+        self._pool_generator = None
+
     def create_meetup_file(self, meetup: Meetup, speakers: list) -> Path:
         """Create a markdown file for a meetup."""
         meetup_dir = self.meetups_dir / meetup.meetup_id
@@ -266,7 +413,7 @@ class HugoMeetupGenerator:
         # Write to file
         markdown_file = meetup_dir / "index.md"
         full_content = frontmatter + content
-        markdown_file.write_text(full_content, encoding="utf-8")
+        markdown_file.write_bytes(full_content.encode("utf-8"))
 
         # Generate descriptions
         self._generate_descriptions(meetup, speakers)
@@ -277,7 +424,7 @@ class HugoMeetupGenerator:
         """Generate all descriptions for a meetup."""
         sponsors_dir = self.data_dir / "sponsors"
         description_generator = MeetupDescriptionGenerator(
-            meetup, speakers, sponsors_dir
+            meetup, speakers, sponsors_dir, self.sponsors_cache_file
         )
         descriptions = description_generator.generate_all()
         self.description_repo.save_all(meetup.meetup_id, descriptions)
@@ -297,13 +444,18 @@ class HugoMeetupGenerator:
 
     def generate_all_meetups(self, repository: GoogleSheetsRepository) -> list[Path]:
         meetups = repository.get_all_enabled_meetups()
-        generated_files = []
-
-        for meetup in meetups:
-            speakers = repository.get_speakers_for_meetup(
-                meetup.meetup_id, repository._fetch_talks_data()
-            )
-            file_path = self.create_meetup_file(meetup, speakers)
-            generated_files.append(file_path)
-
-        return generated_files
+        talks_data = repository._fetch_talks_data()
+        # One pool for every meetup, so worker processes (and the fonts and
+        # backgrounds they have already loaded) are reused between meetups
+        self._share_pool = len(meetups) > 1
+        try:
+            return [
+                self.create_meetup_file(
+                    meetup,
+                    repository.get_speakers_for_meetup(meetup.meetup_id, talks_data),
+                )
+                for meetup in meetups
+            ]
+        finally:
+            self._share_pool = False
+            self._stop_pool()
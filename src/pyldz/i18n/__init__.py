@@ -11,6 +11,13 @@ TRANSLATIONS = {
     },
 }
 
+# TRANSLATIONS flattened so get_text needs a single lookup
+_FLAT_TRANSLATIONS = {
+    (language, key): text
+    for language, texts in TRANSLATIONS.items()
+    for key, text in texts.items()
+}
+
 
 def get_text(language: Language, key: str) -> str:
     """
@@ -23,4 +30,4 @@ def get_text(language: Language, key: str) -> str:
     Returns:
         Translated text or the key itself if translation not found
     """
-    return TRANSLATIONS.get(language, {}).get(key, key)
+    return _FLAT_TRANSLATIONS.get((language, key), key)
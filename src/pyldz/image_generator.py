@@ -1,17 +1,150 @@
 import logging
 import math
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date as date_cls
 from datetime import datetime
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 from typing import Literal, Optional, Tuple
 
 from PIL import Image, ImageDraw, ImageFilter, ImageFont, ImageOps
 
+from pyldz import face_centering
 from pyldz.models import Language, Meetup, Speaker
 
 log = logging.getLogger(__name__)
 
+# nazwy dni tygodnia, indeksowane przez datetime.weekday()
+_DNI_PL = (
+    "PONIEDZIAŁEK",
+    "WTOREK",
+    "ŚRODA",
+    "CZWARTEK",
+    "PIĄTEK",
+    "SOBOTA",
+    "NIEDZIELA",
+)
+_DNI_EN = (
+    "MONDAY",
+    "TUESDAY",
+    "WEDNESDAY",
+    "THURSDAY",
+    "FRIDAY",
+    "SATURDAY",
+    "SUNDAY",
+)
+
+
+# fonty wczytane raz na proces dla każdej pary (plik, rozmiar)
+@lru_cache(maxsize=256)
+def _truetype(path: Path, size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(str(path), size)
+
+
+# pomiar tekstu nie zależy od płótna, więc jedna pomocnicza powierzchnia
+# wystarcza, a wyniki dla tej samej pary (tekst, font) są zapamiętywane
+_MEASURE_DRAW = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+
+
+@lru_cache(maxsize=4096)
+def _text_bbox(text: str, font) -> tuple[int, int, int, int]:
+    return _MEASURE_DRAW.textbbox((0, 0), text, font=font)
+
+
+# półprzezroczyste białe tło pod sekcją prelegentów; alpha_composite nie
+# zmienia źródła, więc ta sama warstwa służy wszystkim wariantom obrazka
+@lru_cache(maxsize=32)
+def _overlay_layer(size: tuple[int, int], alpha: int) -> Image.Image:
+    return Image.new("RGBA", size, (255, 255, 255, alpha))
+
+
+# zapis pliku cache przez plik tymczasowy i os.replace: równoległe procesy
+# renderujące widzą albo stary, albo kompletny nowy plik, nigdy urwany PNG
+def _save_png_atomic(img: Image.Image, path: Path, **params) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            img.save(f, "PNG", **params)
+        os.chmod(tmp, 0o644)  # mkstemp tworzy plik tylko dla właściciela
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+# najmniejszy bok, do którego JPEG avatara może zostać zdekodowany w skali
+_AVATAR_SOURCE_SIZE = 1024
+
+# parametry układu dla każdej proporcji obrazka
+_ASPECT_PRESETS: dict[str, dict] = {
+    "16x9": {
+        "safe_margin": 80,
+        "max_content_width": 1500,
+        "date_block_max_width_ratio": 0.84,
+        "duo_mode": "columns",
+        "single_avatar": 260,  # mniejszy avatar
+        "duo_avatar": 280,
+        "duo_compact_gap": 40,
+        "duo_compact_top_pad": 20,
+        "duo_compact_bottom_pad": 24,
+        "duo_name_font": 32,
+        "duo_title_font": 24,
+        "duo_title_lines": 3,
+        "date_start_px": 136,
+        "date_y_ratio": 0.23,
+        "sep_width_ratio": 0.66,
+        "base_y_gap": 48,
+        "footer_font": 30,
+        "icon_link": 56,
+        "icon_pin": 50,
+    },
+    "4x5": {
+        "safe_margin": 72,
+        "max_content_width": 980,
+        "date_block_max_width_ratio": 0.90,
+        "duo_mode": "compact_columns",
+        "single_avatar": 300,
+        "duo_avatar": 216,
+        "duo_compact_gap": 36,
+        "duo_compact_top_pad": 20,
+        "duo_compact_bottom_pad": 28,
+        "duo_name_font": 34,
+        "duo_title_font": 22,
+        "duo_title_lines": 3,
+        "date_start_px": 122,
+        "date_y_ratio": 0.21,
+        "sep_width_ratio": 0.74,
+        "base_y_gap": 56,
+        "footer_font": 30,
+        "icon_link": 52,
+        "icon_pin": 48,
+    },
+    "1x1": {
+        "safe_margin": 90,  # więcej miejsca od góry i od dołu
+        "max_content_width": 980,
+        "date_block_max_width_ratio": 0.90,
+        "duo_mode": "compact_columns",
+        "single_avatar": 240,  # mniejszy avatar
+        "duo_avatar": 188,
+        "duo_compact_gap": 28,
+        "duo_compact_top_pad": 18,
+        "duo_compact_bottom_pad": 20,
+        "duo_name_font": 28,
+        "duo_title_font": 20,
+        "duo_title_lines": 2,
+        "date_start_px": 118,
+        "date_y_ratio": 0.20,
+        "sep_width_ratio": 0.74,
+        "base_y_gap": 30,  # sekcja prelegenta wyżej nad trójkątem
+        "footer_font": 30,
+        "icon_link": 52,
+        "icon_pin": 48,
+    },
+}
+
 
 class ImageGenerationError(Exception):
     pass
@@ -30,10 +163,18 @@ class MeetupImageGenerator:
     """
 
     # ---------------- init ----------------
-    def __init__(self, assets_dir: Path, cache_dir: Path | None = None):
+    def __init__(
+        self,
+        assets_dir: Path,
+        cache_dir: Path | None = None,
+        png_compress_level: int = 6,
+    ):
         self.assets_dir = assets_dir
+        # poziom zlib dla gotowych obrazków (1 = najszybciej, 9 = najmniejsze)
+        self.png_compress_level = png_compress_level
         self.cache_dir = cache_dir or (assets_dir / "images" / "avatars")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.sized_cache_dir = self.cache_dir / ".cache"
 
         # zasoby
         self.background_path = (
@@ -53,6 +194,18 @@ class MeetupImageGenerator:
         # fonty
         self.font_normal = assets_dir / "fonts" / "OpenSans-Medium.ttf"
         self.font_bold = assets_dir / "fonts" / "OpenSans-Bold.ttf"
+        # wszystkie pliki z assets, z których rysowane są obrazki
+        self.asset_paths = (
+            self.background_path,
+            self.avatar_mask,
+            self.tba_avatar,
+            self.logo_path,
+            self.icon_link,
+            self.icon_pin,
+            self.icon_flag_gb,
+            self.font_normal,
+            self.font_bold,
+        )
 
         # paleta
         self.YA = "#FFD700"  # Żółty Akcent
@@ -61,6 +214,26 @@ class MeetupImageGenerator:
         self.CT = "#333333"  # Ciemny Tekst
         self.SS = "#666666"  # Średni Szary
 
+        # logo i ikony przeskalowane raz na generator:
+        # (ścieżka, rozmiar) -> (obraz, czy jest w pełni nieprzezroczysty)
+        self._asset_cache: dict[
+            tuple[Path, int | tuple[int, int]], tuple[Image.Image, bool]
+        ] = {}
+        # gotowe płótno z tłem dla każdej proporcji
+        self._bg_cache: dict[str, Image.Image] = {}
+        # cień i ring avatara dla każdego rozmiaru
+        self._frame_cache: dict[int, Image.Image] = {}
+        # maska avatara (tryb L) dla każdego rozmiaru
+        self._mask_cache: dict[tuple[int, int], Image.Image] = {}
+
+    def __getstate__(self) -> dict:
+        # do procesów roboczych trafia sama konfiguracja; cache obrazków każdy
+        # proces buduje sobie sam
+        state = self.__dict__.copy()
+        for name in ("_asset_cache", "_bg_cache", "_frame_cache", "_mask_cache"):
+            state[name] = {}
+        return state
+
     # ---------------- public ----------------
     def generate_featured_image(
         self,
@@ -76,26 +249,8 @@ class MeetupImageGenerator:
 
         preset = self._aspect_preset(aspect_ratio)
         opt = {
-            "safe_margin": preset["safe_margin"],
-            "max_content_width": preset["max_content_width"],
-            "date_block_max_width_ratio": preset["date_block_max_width_ratio"],
+            **preset,
             "overlay_opacity": 0.04,
-            "duo_mode": preset["duo_mode"],
-            "single_avatar": preset["single_avatar"],
-            "duo_avatar": preset["duo_avatar"],
-            "duo_compact_gap": preset["duo_compact_gap"],
-            "duo_compact_top_pad": preset["duo_compact_top_pad"],
-            "duo_compact_bottom_pad": preset["duo_compact_bottom_pad"],
-            "duo_name_font": preset["duo_name_font"],
-            "duo_title_font": preset["duo_title_font"],
-            "duo_title_lines": preset["duo_title_lines"],
-            "date_start_px": preset["date_start_px"],
-            "date_y_ratio": preset["date_y_ratio"],
-            "sep_width_ratio": preset["sep_width_ratio"],
-            "base_y_gap": preset["base_y_gap"],
-            "footer_font": preset["footer_font"],
-            "icon_link": preset["icon_link"],
-            "icon_pin": preset["icon_pin"],
             "link_enabled": aspect_ratio == "16x9",
         }
         if options:
@@ -103,8 +258,7 @@ class MeetupImageGenerator:
 
         try:
             # canvas + tło
-            img = self._canvas(aspect_ratio)
-            self._composite_background(img, fade=0.05)
+            img = self._base_canvas(aspect_ratio)
             draw = ImageDraw.Draw(img)
 
             # nagłówek
@@ -129,7 +283,7 @@ class MeetupImageGenerator:
             )
             date_y = int(img.height * opt["date_y_ratio"])
             self._text_center_shadowed(
-                draw, date_label, img.width // 2, date_y, font_date, self.YA
+                img, date_label, img.width // 2, date_y, font_date, self.YA
             )
 
             if time_label or day_name:
@@ -137,17 +291,13 @@ class MeetupImageGenerator:
                 time_font = self._load_font(
                     self.font_bold, max(40, int(font_date.size * 0.62))
                 )
-                combo_y = (
-                    date_y + draw.textbbox((0, 0), date_label, font=font_date)[3] + 8
-                )
+                combo_y = date_y + _text_bbox(date_label, font_date)[3] + 8
                 self._text_center_shadowed(
-                    draw, combo, img.width // 2, combo_y, time_font, self.CT
+                    img, combo, img.width // 2, combo_y, time_font, self.CT
                 )
-                block_bottom = combo_y + draw.textbbox((0, 0), combo, font=time_font)[3]
+                block_bottom = combo_y + _text_bbox(combo, time_font)[3]
             else:
-                block_bottom = (
-                    date_y + draw.textbbox((0, 0), date_label, font=font_date)[3]
-                )
+                block_bottom = date_y + _text_bbox(date_label, font_date)[3]
 
             # separator (brak tekstu pod datą)
             sep_w = int(img.width * opt["sep_width_ratio"])
@@ -162,13 +312,14 @@ class MeetupImageGenerator:
                 self._layout_tba(img, base_y, opt)
             elif meetup.has_single_talk:
                 sp = self._find_speaker(speakers, meetup.talks[0].speaker_id)
-                self._layout_single(img, sp, meetup.talks[0].title, opt, base_y)
+                self._layout_single(img, draw, sp, meetup.talks[0].title, opt, base_y)
             elif meetup.has_two_talks:
                 sp1 = self._find_speaker(speakers, meetup.talks[0].speaker_id)
                 sp2 = self._find_speaker(speakers, meetup.talks[1].speaker_id)
                 if opt["duo_mode"] == "columns":
                     self._layout_duo_columns(
                         img,
+                        draw,
                         sp1,
                         meetup.talks[0].title,
                         sp2,
@@ -179,6 +330,7 @@ class MeetupImageGenerator:
                 elif opt["duo_mode"] == "compact_columns":
                     self._layout_duo_compact_columns(
                         img,
+                        draw,
                         sp1,
                         meetup.talks[0].title,
                         sp2,
@@ -189,6 +341,7 @@ class MeetupImageGenerator:
                 else:
                     self._layout_duo_stack(
                         img,
+                        draw,
                         sp1,
                         meetup.talks[0].title,
                         sp2,
@@ -206,7 +359,11 @@ class MeetupImageGenerator:
             )
 
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            img.save(output_path, "PNG")
+            # grafika leży na nieprzezroczystym tle, więc kanał alfa nic nie
+            # wnosi, a PNG w RGB to o jedną czwartą mniej danych do kompresji
+            img.convert("RGB").save(
+                output_path, "PNG", compress_level=self.png_compress_level
+            )
             return output_path
 
         except Exception as e:
@@ -215,93 +372,51 @@ class MeetupImageGenerator:
                 f"Failed to generate image for meetup {getattr(meetup, 'meetup_id', '?')}: {e}"
             ) from e
 
+    def prepare_avatars(self, speakers: list[Speaker]) -> None:
+        """Make sure every speaker's processed avatar is in the cache directory.
+
+        Lets several processes render images for the same speakers without
+        racing to write the same avatar files. Avatars are decoded, centered
+        and written in a thread pool, since Pillow and zlib release the GIL.
+        """
+        unique = list({speaker.id: speaker for speaker in speakers}.values())
+        if len(unique) > 1:
+            if any(
+                not (self.cache_dir / f"{speaker.id}.png").exists()
+                for speaker in unique
+            ):
+                # detektor ładujemy raz, zanim wątki zaczną o niego konkurować
+                face_centering.load_detector()
+            with ThreadPoolExecutor(max_workers=min(len(unique), 8)) as executor:
+                list(executor.map(self._prepare_avatar, unique))
+        else:
+            for speaker in unique:
+                self._prepare_avatar(speaker)
+
+    def _prepare_avatar(self, speaker: Speaker) -> None:
+        try:
+            self._processed_avatar(speaker)
+        except Exception as e:
+            raise ImageGenerationError(
+                f"Failed to load avatar for {speaker.name}: {e}"
+            ) from e
+
     # ---------------- aspect presets ----------------
     def _aspect_preset(self, aspect: str) -> dict:
-        if aspect == "16x9":
-            return {
-                "safe_margin": 80,
-                "max_content_width": 1500,
-                "date_block_max_width_ratio": 0.84,
-                "duo_mode": "columns",
-                "single_avatar": 260,  # mniejszy avatar
-                "duo_avatar": 280,
-                "duo_compact_gap": 40,
-                "duo_compact_top_pad": 20,
-                "duo_compact_bottom_pad": 24,
-                "duo_name_font": 32,
-                "duo_title_font": 24,
-                "duo_title_lines": 3,
-                "date_start_px": 136,
-                "date_y_ratio": 0.23,
-                "sep_width_ratio": 0.66,
-                "base_y_gap": 48,
-                "footer_font": 30,
-                "icon_link": 56,
-                "icon_pin": 50,
-            }
-        if aspect == "4x5":
-            return {
-                "safe_margin": 72,
-                "max_content_width": 980,
-                "date_block_max_width_ratio": 0.90,
-                "duo_mode": "compact_columns",
-                "single_avatar": 300,
-                "duo_avatar": 216,
-                "duo_compact_gap": 36,
-                "duo_compact_top_pad": 20,
-                "duo_compact_bottom_pad": 28,
-                "duo_name_font": 34,
-                "duo_title_font": 22,
-                "duo_title_lines": 3,
-                "date_start_px": 122,
-                "date_y_ratio": 0.21,
-                "sep_width_ratio": 0.74,
-                "base_y_gap": 56,
-                "footer_font": 30,
-                "icon_link": 52,
-                "icon_pin": 48,
-            }
-        if aspect == "1x1":
-            return {
-                "safe_margin": 90,  # więcej miejsca od góry i od dołu
-                "max_content_width": 980,
-                "date_block_max_width_ratio": 0.90,
-                "duo_mode": "compact_columns",
-                "single_avatar": 240,  # mniejszy avatar
-                "duo_avatar": 188,
-                "duo_compact_gap": 28,
-                "duo_compact_top_pad": 18,
-                "duo_compact_bottom_pad": 20,
-                "duo_name_font": 28,
-                "duo_title_font": 20,
-                "duo_title_lines": 2,
-                "date_start_px": 118,
-                "date_y_ratio": 0.20,
-                "sep_width_ratio": 0.74,
-                "base_y_gap": 30,  # sekcja prelegenta wyżej nad trójkątem
-                "footer_font": 30,
-                "icon_link": 52,
-                "icon_pin": 48,
-            }
-        return self._aspect_preset("16x9")
+        return _ASPECT_PRESETS.get(aspect, _ASPECT_PRESETS["16x9"])
 
     # ---------------- header ----------------
     def _draw_header_centered(
         self, img: Image.Image, draw: ImageDraw.ImageDraw, title: str, opt: dict
     ):
         font_title = self._load_font(self.font_bold, 70)
-        title_w = draw.textbbox((0, 0), title, font=font_title)[2]
+        title_w = _text_bbox(title, font_title)[2]
 
         logo_w = 0
         logo_img = None
         if self.logo_path.exists():
             try:
-                logo_img = Image.open(self.logo_path).convert("RGBA")
-                target_h = 110
-                ratio = target_h / logo_img.height
-                logo_img = logo_img.resize(
-                    (int(logo_img.width * ratio), target_h), Image.Resampling.LANCZOS
-                )
+                logo_img = self._scaled_asset(self.logo_path, 110)
                 logo_w = logo_img.width + 18
             except Exception as e:
                 log.warning(f"Cannot load logo: {e}")
@@ -400,21 +515,17 @@ class MeetupImageGenerator:
         flag_w = flag_h
         if self.icon_flag_gb and self.icon_flag_gb.exists():
             try:
-                flag_img = (
-                    Image.open(self.icon_flag_gb)
-                    .convert("RGBA")
-                    .resize((flag_w, flag_h), Image.Resampling.LANCZOS)
-                )
+                flag_img = self._scaled_asset(self.icon_flag_gb, (flag_w, flag_h))
             except Exception:
                 flag_img = None
 
         font = self._load_font(self.font_bold, 34)
-        label_w = cd.textbbox((0, 0), label, font=font)[2]
+        _, _, label_w, label_h = _text_bbox(label, font)
         gap = 12 if flag_img else 0
         total_w = label_w + (flag_w + gap if flag_img else 0)
 
         x0 = max(0, (box_w - total_w - 2) // 2)
-        y0 = (box_h - cd.textbbox((0, 0), label, font=font)[3]) // 2
+        y0 = (box_h - label_h) // 2
 
         if flag_img:
             content.alpha_composite(flag_img, (x0, (box_h - flag_h + 10) // 2))
@@ -457,7 +568,7 @@ class MeetupImageGenerator:
 
         font_site = self._load_font(self.font_normal, opt["footer_font"])
 
-        site_bbox = draw.textbbox((0, 0), site_text, font=font_site)
+        site_bbox = _text_bbox(site_text, font_site)
 
         site_w, site_h = site_bbox[2], site_bbox[3]
 
@@ -495,17 +606,13 @@ class MeetupImageGenerator:
 
         # środek – lokalizacja (pin + tekst)
         small_font = self._load_font(self.font_normal, max(22, opt["footer_font"]))
-        place_w = draw.textbbox((0, 0), place_text, font=small_font)[2]
+        place_w = _text_bbox(place_text, small_font)[2]
         pin_sz = min(opt["icon_pin"], 28)
         pin_x = (width // 2) - (place_w // 2) - pin_sz - 10
         pin_y = height - pad - (small_font.size // 2) - 2
         if self.icon_pin.exists():
             try:
-                pin = (
-                    Image.open(self.icon_pin)
-                    .convert("RGBA")
-                    .resize((pin_sz, pin_sz), Image.Resampling.LANCZOS)
-                )
+                pin = self._scaled_asset(self.icon_pin, (pin_sz, pin_sz))
                 img.alpha_composite(pin, (pin_x, pin_y))
             except Exception as e:
                 log.warning(f"Cannot load pin icon: {e}")
@@ -522,19 +629,25 @@ class MeetupImageGenerator:
     def _layout_tba(self, img: Image.Image, base_y: int, opt: dict):
         cx = img.width // 2
         d = 300
-        badge = self._tba_badge(d)
+        badge, opaque = self._tba_badge(d)
         y = base_y + 10
-        img.paste(badge, (cx - d // 2, y), badge)
+        # nieprzezroczysty badge wklejamy bez maski
+        img.paste(badge, (cx - d // 2, y), None if opaque else badge)
 
     def _layout_single(
-        self, img: Image.Image, sp: Speaker, title: str, opt: dict, base_y: int
+        self,
+        img: Image.Image,
+        draw: ImageDraw.ImageDraw,
+        sp: Speaker,
+        title: str,
+        opt: dict,
+        base_y: int,
     ):
         """
         Jedna prelekcja:
         - avatar wycentrowany
         - nazwisko i tytuł POD avatarem (nie zachodzą na twarz)
         """
-        draw = ImageDraw.Draw(img)
         box_w = min(opt["max_content_width"], img.width - 2 * opt["safe_margin"])
         box_x = (img.width - box_w) // 2
         box_y = base_y
@@ -545,7 +658,7 @@ class MeetupImageGenerator:
 
         av = self._apply_circular_mask(self._avatar(sp, (size, size)))
         lines = self._wrap_unbounded(draw, title, title_f, int(box_w * 0.9))
-        name_h = draw.textbbox((0, 0), sp.name, font=name_f)[3]
+        name_h = _text_bbox(sp.name, name_f)[3]
         title_h = self._multiline_height(draw, lines, title_f, gap=8)
 
         # overlay pod całą sekcją (avatar + tekst poniżej) z nieco mniejszymi marginesami
@@ -572,6 +685,7 @@ class MeetupImageGenerator:
     def _layout_duo_columns(
         self,
         img: Image.Image,
+        draw: ImageDraw.ImageDraw,
         sp1: Speaker,
         t1: str,
         sp2: Speaker,
@@ -579,7 +693,6 @@ class MeetupImageGenerator:
         opt: dict,
         base_y: int,
     ):
-        draw = ImageDraw.Draw(img)
         box_w = min(opt["max_content_width"], img.width - 2 * opt["safe_margin"])
         box_x = (img.width - box_w) // 2
         box_y = base_y
@@ -592,8 +705,8 @@ class MeetupImageGenerator:
 
         lines1 = self._wrap_unbounded(draw, t1, title_f, col_w - size - 46)
         lines2 = self._wrap_unbounded(draw, t2, title_f, col_w - size - 46)
-        name_h1 = draw.textbbox((0, 0), sp1.name, font=name_f)[3]
-        name_h2 = draw.textbbox((0, 0), sp2.name, font=name_f)[3]
+        name_h1 = _text_bbox(sp1.name, name_f)[3]
+        name_h2 = _text_bbox(sp2.name, name_f)[3]
 
         self._overlay(
             img,
@@ -626,6 +739,7 @@ class MeetupImageGenerator:
     def _layout_duo_stack(
         self,
         img: Image.Image,
+        draw: ImageDraw.ImageDraw,
         sp1: Speaker,
         t1: str,
         sp2: Speaker,
@@ -633,7 +747,6 @@ class MeetupImageGenerator:
         opt: dict,
         base_y: int,
     ):
-        draw = ImageDraw.Draw(img)
         box_w = min(opt["max_content_width"], img.width - 2 * opt["safe_margin"])
         box_x = (img.width - box_w) // 2
         size = opt["duo_avatar"]
@@ -641,7 +754,7 @@ class MeetupImageGenerator:
         title_f = self._load_font(self.font_bold, int(24 * 1.2))
 
         lines1 = self._wrap_unbounded(draw, t1, title_f, int(box_w * 0.9))
-        name_h1 = draw.textbbox((0, 0), sp1.name, font=name_f)[3]
+        name_h1 = _text_bbox(sp1.name, name_f)[3]
         self._overlay(
             img,
             (box_x, base_y, box_x + box_w, base_y + size + 220),
@@ -659,7 +772,7 @@ class MeetupImageGenerator:
 
         off_y = base_y + size + 240
         lines2 = self._wrap_unbounded(draw, t2, title_f, int(box_w * 0.9))
-        name_h2 = draw.textbbox((0, 0), sp2.name, font=name_f)[3]
+        name_h2 = _text_bbox(sp2.name, name_f)[3]
         self._overlay(
             img,
             (box_x, off_y, box_x + box_w, off_y + size + 220),
@@ -678,6 +791,7 @@ class MeetupImageGenerator:
     def _layout_duo_compact_columns(
         self,
         img: Image.Image,
+        draw: ImageDraw.ImageDraw,
         sp1: Speaker,
         t1: str,
         sp2: Speaker,
@@ -685,7 +799,6 @@ class MeetupImageGenerator:
         opt: dict,
         base_y: int,
     ):
-        draw = ImageDraw.Draw(img)
         box_w = min(opt["max_content_width"], img.width - 2 * opt["safe_margin"])
         box_x = (img.width - box_w) // 2
         box_y = base_y
@@ -733,8 +846,8 @@ class MeetupImageGenerator:
             opt["duo_title_lines"],
         )
 
-        name_h1 = draw.textbbox((0, 0), sp1.name, font=name_f1)[3]
-        name_h2 = draw.textbbox((0, 0), sp2.name, font=name_f2)[3]
+        name_h1 = _text_bbox(sp1.name, name_f1)[3]
+        name_h2 = _text_bbox(sp2.name, name_f2)[3]
         title_h1 = self._multiline_height(draw, lines1, title_f, gap=6)
         title_h2 = self._multiline_height(draw, lines2, title_f, gap=6)
 
@@ -780,6 +893,16 @@ class MeetupImageGenerator:
         )
 
     # ---------------- canvas/bg ----------------
+    def _base_canvas(self, aspect: str) -> Image.Image:
+        # tło jest takie samo dla każdej grafiki o danej proporcji, więc
+        # skalowanie i rozjaśnianie robimy raz, a potem tylko kopiujemy
+        base = self._bg_cache.get(aspect)
+        if base is None:
+            base = self._canvas(aspect)
+            self._composite_background(base, fade=0.05)
+            self._bg_cache[aspect] = base
+        return base.copy()
+
     def _canvas(self, aspect: str) -> Image.Image:
         if aspect == "4x5":
             return Image.new("RGBA", (1080, 1350), (245, 245, 245, 255))
@@ -795,12 +918,18 @@ class MeetupImageGenerator:
             ratio = max(canvas.width / bg.width, canvas.height / bg.height)
             new_size = (int(bg.width * ratio), int(bg.height * ratio))
             bg = bg.resize(new_size, Image.Resampling.LANCZOS)
-            bg = Image.blend(
-                Image.new("RGBA", new_size, (255, 255, 255, 255)), bg, fade
-            )
+            # rozjaśnienie = Image.blend z białym obrazem, ale jako tablica
+            # LUT na kanałach, bez alokowania białego obrazu tej samej wielkości
+            fade_lut = [int(255 + fade * (v - 255)) for v in range(256)]
+            bg = bg.point(fade_lut * 4)
             x = (canvas.width - new_size[0]) // 2
             y = (canvas.height - new_size[1]) // 2
-            canvas.alpha_composite(bg, (x, y))
+            if bg.getextrema()[3][0] == 255:
+                # nieprzezroczyste tło zakrywa płótno w całości – wystarczy
+                # skopiować piksele zamiast mieszać je z płótnem
+                canvas.paste(bg, (x, y))
+            else:
+                canvas.alpha_composite(bg, (x, y))
         except Exception as e:
             log.warning(f"Background compose failed: {e}")
 
@@ -809,8 +938,15 @@ class MeetupImageGenerator:
         self, meetup: Meetup, lang: Language
     ) -> Tuple[str, str, str]:
         dt: Optional[datetime] = None
-        for attr in ("starts_at", "start", "datetime", "date"):
-            val = getattr(meetup, attr, None)
+        if isinstance(meetup, Meetup):
+            # model Meetup ma tylko pole `date`, pozostałych nazw nie szukamy
+            candidates = (meetup.date,)
+        else:
+            candidates = (
+                getattr(meetup, attr, None)
+                for attr in ("starts_at", "start", "datetime", "date")
+            )
+        for val in candidates:
             if isinstance(val, datetime):
                 dt = val
                 break
@@ -827,32 +963,13 @@ class MeetupImageGenerator:
         except Exception:
             lang_code = "pl"
 
-        dni_pl = [
-            "PONIEDZIAŁEK",
-            "WTOREK",
-            "ŚRODA",
-            "CZWARTEK",
-            "PIĄTEK",
-            "SOBOTA",
-            "NIEDZIELA",
-        ]
-        dni_en = [
-            "MONDAY",
-            "TUESDAY",
-            "WEDNESDAY",
-            "THURSDAY",
-            "FRIDAY",
-            "SATURDAY",
-            "SUNDAY",
-        ]
-
         if dt:
             date_label = f"{dt.year:04d} {dt.month:02d} {dt.day:02d}"
             time_label = dt.strftime("%H:%M")
             day_name = (
-                dni_en[dt.weekday()]
+                _DNI_EN[dt.weekday()]
                 if lang_code.startswith("en")
-                else dni_pl[dt.weekday()]
+                else _DNI_PL[dt.weekday()]
             )
             return day_name, date_label, time_label
 
@@ -876,47 +993,27 @@ class MeetupImageGenerator:
     # ---------------- text with shadow helpers ----------------
     def _text_center_shadowed(
         self,
-        draw: ImageDraw.ImageDraw,
+        img: Image.Image,
         text: str,
         cx: int,
         y: int,
         font: ImageFont.FreeTypeFont,
         color: str,
     ):
-        img = getattr(draw, "_image", None)
-        if img is None:
-            core = getattr(draw, "im", None)
-            if core is not None and hasattr(core, "size") and hasattr(core, "mode"):
-                img = Image.new(core.mode, core.size)
-            else:
-                raise RuntimeError("Cannot access base Image from ImageDraw")
-        if not hasattr(img, "alpha_composite"):
-            raise RuntimeError("Expected PIL.Image.Image as drawing surface")
-
-        w = draw.textbbox((0, 0), text, font=font)[2]
+        w = _text_bbox(text, font)[2]
         x = cx - w // 2
         self._draw_text_with_shadow(img, text, (x, y), font, color)
 
     def _text_right_shadowed(
         self,
-        draw: ImageDraw.ImageDraw,
+        img: Image.Image,
         text: str,
         right_x: int,
         y: int,
         font: ImageFont.FreeTypeFont,
         color: str,
     ):
-        img = getattr(draw, "_image", None)
-        if img is None:
-            core = getattr(draw, "im", None)
-            if core is not None and hasattr(core, "size") and hasattr(core, "mode"):
-                img = Image.new(core.mode, core.size)
-            else:
-                raise RuntimeError("Cannot access base Image from ImageDraw")
-        if not hasattr(img, "alpha_composite"):
-            raise RuntimeError("Expected PIL.Image.Image as drawing surface")
-
-        w = draw.textbbox((0, 0), text, font=font)[2]
+        w = _text_bbox(text, font)[2]
         x = right_x - w
         self._draw_text_with_shadow(
             img, text, (x, y), font, color, shadow_color=(255, 255, 255, 110)
@@ -936,36 +1033,46 @@ class MeetupImageGenerator:
         if not hasattr(base_img, "alpha_composite"):
             raise RuntimeError("Expected PIL.Image.Image as base_img")
 
-        shadow_layer = Image.new("RGBA", base_img.size, (0, 0, 0, 0))
-        sd = ImageDraw.Draw(shadow_layer)
+        # warstwy obejmują tylko tekst, cień i zasięg rozmycia (przycięte do
+        # płótna), a nie całe płótno – poza tym obszarem i tak są przezroczyste
         x, y = pos
-        sd.text((x + offset[0], y + offset[1]), text, font=font, fill=shadow_color)
-        if blur > 0:
-            shadow_layer = shadow_layer.filter(ImageFilter.GaussianBlur(blur))
-        base_img.alpha_composite(shadow_layer)
-
-        text_layer = Image.new("RGBA", base_img.size, (0, 0, 0, 0))
+        dx, dy = offset
+        bl, bt, br, bb = _text_bbox(text, font)
+        pad = 4 * blur + 2
+        left = max(0, x + min(bl, bl + dx) - pad)
+        top = max(0, y + min(bt, bt + dy) - pad)
+        right = min(base_img.width, x + max(br, br + dx) + pad)
+        bottom = min(base_img.height, y + max(bb, bb + dy) + pad)
+        if right <= left or bottom <= top:
+            return
+        size = (right - left, bottom - top)
+        x, y = x - left, y - top
+
+        # całkowicie przezroczysty cień nic nie zmienia – pomijamy warstwę
+        if shadow_color[3] > 0:
+            shadow_layer = Image.new("RGBA", size, (0, 0, 0, 0))
+            sd = ImageDraw.Draw(shadow_layer)
+            sd.text((x + dx, y + dy), text, font=font, fill=shadow_color)
+            if blur > 0:
+                shadow_layer = shadow_layer.filter(ImageFilter.GaussianBlur(blur))
+            base_img.alpha_composite(shadow_layer, (left, top))
+
+        text_layer = Image.new("RGBA", size, (0, 0, 0, 0))
         td = ImageDraw.Draw(text_layer)
         td.text((x, y), text, font=font, fill=fill)
-        base_img.alpha_composite(text_layer)
+        base_img.alpha_composite(text_layer, (left, top))
 
     # ---------------- helpers - text & drawing ----------------
     def _overlay(self, img: Image.Image, box, opacity: float):
         alpha = max(0, min(255, int(opacity * 255)))
-        overlay = Image.new(
-            "RGBA", (box[2] - box[0], box[3] - box[1]), (255, 255, 255, alpha)
-        )
+        overlay = _overlay_layer((box[2] - box[0], box[3] - box[1]), alpha)
         img.alpha_composite(overlay, (box[0], box[1]))
 
     def _autoscale_font(self, draw, text, font_path: Path, start: int, max_width: int):
-        size = start
-        while size >= 40:
-            f = self._load_font(font_path, size)
-            w = draw.textbbox((0, 0), text, font=f)[2]
-            if w <= max_width:
-                return f
-            size -= 2
-        return self._load_font(font_path, 40)
+        size = self._largest_fitting_size(
+            text, font_path, range(start, 39, -2), max_width
+        )
+        return self._load_font(font_path, 40 if size is None else size)
 
     def _fit_font(
         self,
@@ -976,24 +1083,46 @@ class MeetupImageGenerator:
         max_width: int,
         min_size: int = 18,
     ):
-        size = start
-        while size >= min_size:
-            font = self._load_font(font_path, size)
-            if draw.textbbox((0, 0), text, font=font)[2] <= max_width:
-                return font
-            size -= 1
-        return self._load_font(font_path, min_size)
+        size = self._largest_fitting_size(
+            text, font_path, range(start, min_size - 1, -1), max_width
+        )
+        return self._load_font(font_path, min_size if size is None else size)
+
+    def _largest_fitting_size(
+        self, text: str, font_path: Path, sizes: range, max_width: int
+    ) -> int | None:
+        # szerokość rośnie z rozmiarem fontu, więc pierwszy pasujący rozmiar
+        # z malejącego ciągu można znaleźć bisekcją zamiast sprawdzać każdy
+        lo, hi = 0, len(sizes)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            font = self._load_font(font_path, sizes[mid])
+            if _text_bbox(text, font)[2] <= max_width:
+                hi = mid
+            else:
+                lo = mid + 1
+        return sizes[lo] if lo < len(sizes) else None
 
     def _wrap_unbounded(self, draw, text, font, max_w):
         words, lines, cur = text.split(), [], []
+        space_w = font.getlength(" ")
+        # przesunięcie pióra po bieżącej linii wraz ze spacją na końcu
+        cur_advance = 0.0
         for w in words:
-            test = " ".join(cur + [w])
-            if draw.textbbox((0, 0), test, font=font)[2] <= max_w:
+            # prawa krawędź linii z dopisanym słowem = przesunięcie pióra
+            # + zasięg samego słowa; przy samej granicy mierzymy całość, bo
+            # silnik układu tekstu może kernować przez spację
+            width = cur_advance + _text_bbox(w, font)[2]
+            if abs(width - max_w) <= 2:
+                width = _text_bbox(" ".join(cur + [w]), font)[2]
+            if width <= max_w:
                 cur.append(w)
+                cur_advance += font.getlength(w) + space_w
             else:
                 if cur:
                     lines.append(" ".join(cur))
                 cur = [w]
+                cur_advance = font.getlength(w) + space_w
         if cur:
             lines.append(" ".join(cur))
         return lines
@@ -1006,10 +1135,7 @@ class MeetupImageGenerator:
         truncated = lines[: max_lines - 1]
         last_line = " ".join(lines[max_lines - 1 :]).strip()
 
-        while (
-            last_line
-            and draw.textbbox((0, 0), f"{last_line}…", font=font)[2] > max_w
-        ):
+        while last_line and _text_bbox(f"{last_line}…", font)[2] > max_w:
             if " " in last_line:
                 last_line = last_line.rsplit(" ", 1)[0]
             else:
@@ -1023,114 +1149,146 @@ class MeetupImageGenerator:
             return 0
         h = 0
         for ln in lines:
-            h += draw.textbbox((0, 0), ln, font=font)[3] + gap
+            h += _text_bbox(ln, font)[3] + gap
         return h - gap
 
     def _text_center(self, draw, text, x_center, y, font, color):
-        w = draw.textbbox((0, 0), text, font=font)[2]
+        w = _text_bbox(text, font)[2]
         draw.text((x_center - w // 2, y), text, fill=color, font=font)
 
     def _text_right(self, draw, text, right_x, y, font, color):
-        w = draw.textbbox((0, 0), text, font=font)[2]
+        w = _text_bbox(text, font)[2]
         draw.text((right_x - w, y), text, fill=color, font=font)
 
     def _text_center_multiline(self, draw, lines, cx, top_y, font, color, gap=6):
         y = top_y
         for ln in lines:
-            w = draw.textbbox((0, 0), ln, font=font)[2]
+            _, _, w, h = _text_bbox(ln, font)
             draw.text((cx - w // 2, y), ln, fill=color, font=font)
-            y += draw.textbbox((0, 0), ln, font=font)[3] + gap
+            y += h + gap
 
     def _text_multiline(self, draw, lines, x, top_y, font, color, gap=6):
         y = top_y
         for ln in lines:
             draw.text((x, y), ln, fill=color, font=font)
-            y += draw.textbbox((0, 0), ln, font=font)[3] + gap
+            y += _text_bbox(ln, font)[3] + gap
 
     def _text_right_multiline(self, draw, lines, right_x, top_y, font, color, gap=6):
         y = top_y
         for ln in lines:
-            w = draw.textbbox((0, 0), ln, font=font)[2]
+            _, _, w, h = _text_bbox(ln, font)
             draw.text((right_x - w, y), ln, fill=color, font=font)
-            y += draw.textbbox((0, 0), ln, font=font)[3] + gap
+            y += h + gap
 
     # ---------------- helpers - assets ----------------
+    def _scaled_asset(self, path: Path, size: int | tuple[int, int]) -> Image.Image:
+        """Obraz z assets jako RGBA w rozmiarze `size` (liczba = sama wysokość)."""
+        return self._scaled_asset_entry(path, size)[0]
+
+    def _scaled_asset_entry(
+        self, path: Path, size: int | tuple[int, int]
+    ) -> tuple[Image.Image, bool]:
+        """Jak `_scaled_asset`, razem z flagą pełnej nieprzezroczystości."""
+        key = (path, size)
+        cached = self._asset_cache.get(key)
+        if cached is None:
+            img = Image.open(path).convert("RGBA")
+            if isinstance(size, int):
+                size = (int(img.width * (size / img.height)), size)
+            img = img.resize(size, Image.Resampling.LANCZOS)
+            cached = (img, img.getchannel("A").getextrema() == (255, 255))
+            self._asset_cache[key] = cached
+        return cached
+
     def _find_speaker(self, speakers: list[Speaker], speaker_id: str) -> Speaker:
         return next(s for s in speakers if s.id == speaker_id)
 
     def _load_font(self, path: Path, size: int):
         try:
-            return ImageFont.truetype(str(path), size)
+            return _truetype(path, size)
         except OSError:
             log.warning("Could not load font %s, using default", path)
             return ImageFont.load_default()
 
+    def _processed_avatar(self, speaker: Speaker) -> Image.Image:
+        raw = self.cache_dir / f"{speaker.id}_original.png"
+        processed = self.cache_dir / f"{speaker.id}.png"
+        if processed.exists():
+            return Image.open(processed).convert("RGBA")
+
+        if raw.exists():
+            original = Image.open(raw).convert("RGBA")
+        else:
+            original = Image.open(BytesIO(speaker.avatar.content))
+            # duże zdjęcia JPEG dekodujemy od razu w zmniejszonej skali DCT
+            # (dla PNG to no-op); wycięta twarz i tak jest dużo mniejsza
+            original.draft("RGB", (_AVATAR_SOURCE_SIZE, _AVATAR_SOURCE_SIZE))
+            original = original.convert("RGBA")
+            # kopia pobranego zdjęcia jest tylko cache'em, więc liczy się czas zapisu
+            _save_png_atomic(original, raw, compress_level=1)
+
+        try:
+            centered = face_centering.detect_and_center_square(original)
+            _save_png_atomic(centered, processed)
+            return centered
+        except face_centering.FaceDetectionError:
+            _save_png_atomic(original, processed)
+            return original
+
     def _avatar(self, speaker: Speaker, size: tuple[int, int]) -> Image.Image:
+        # gotowe warianty w docelowym rozmiarze, żeby nie skalować LANCZOS-em
+        # przy każdym renderze; nieaktualne, gdy avatar przetworzono od nowa
+        sized = self.sized_cache_dir / f"{speaker.id}@{size[0]}x{size[1]}.png"
+        processed = self.cache_dir / f"{speaker.id}.png"
         try:
-            raw = self.cache_dir / f"{speaker.id}_original.png"
-            processed = self.cache_dir / f"{speaker.id}.png"
-            if processed.exists():
-                img = Image.open(processed).convert("RGBA")
-            else:
-                if raw.exists():
-                    original = Image.open(raw).convert("RGBA")
-                else:
-                    original = Image.open(BytesIO(speaker.avatar.content)).convert(
-                        "RGBA"
-                    )
-                    original.save(raw, "PNG")
-                from pyldz import face_centering
-
-                try:
-                    centered = face_centering.detect_and_center_square(original)
-                    centered.save(processed, "PNG")
-                    img = centered
-                except face_centering.FaceDetectionError:
-                    original.save(processed, "PNG")
-                    img = original
-            return ImageOps.fit(
-                img,
+            if (
+                sized.exists()
+                and processed.exists()
+                and sized.stat().st_mtime >= processed.stat().st_mtime
+            ):
+                return Image.open(sized).convert("RGBA")
+            img = ImageOps.fit(
+                self._processed_avatar(speaker),
                 size,
                 method=Image.Resampling.LANCZOS,
             )
+            self.sized_cache_dir.mkdir(parents=True, exist_ok=True)
+            _save_png_atomic(img, sized, compress_level=1)
+            return img
         except Exception as e:
             raise ImageGenerationError(
                 f"Failed to load avatar for {speaker.name}: {e}"
             ) from e
 
     def _apply_circular_mask(self, img: Image.Image) -> Image.Image:
-        if not self.avatar_mask.exists():
-            return self._circle_mask(img)
-        try:
-            m = (
-                Image.open(self.avatar_mask)
-                .convert("L")
-                .resize(img.size, Image.Resampling.LANCZOS)
-            )
-            out = Image.new("RGBA", img.size, (0, 0, 0, 0))
-            out.paste(img, (0, 0))
-            out.putalpha(m)
-            return out
-        except Exception:
-            return self._circle_mask(img)
-
-    def _circle_mask(self, img: Image.Image) -> Image.Image:
-        size = img.size
-        m = Image.new("L", size, 0)
-        d = ImageDraw.Draw(m)
-        d.ellipse((0, 0) + size, fill=255)
-        out = Image.new("RGBA", size, (0, 0, 0, 0))
-        out.paste(img, (0, 0))
-        out.putalpha(m)
+        out = img.convert("RGBA")  # kopia, także gdy obraz już jest RGBA
+        out.putalpha(self._circle_mask(img.size))
         return out
 
-    def _tba_badge(self, diameter: int) -> Image.Image:
+    def _circle_mask(self, size: tuple[int, int]) -> Image.Image:
+        """Maska avatara (z mask.png albo narysowane koło), raz na rozmiar."""
+        m = self._mask_cache.get(size)
+        if m is not None:
+            return m
+        if self.avatar_mask.exists():
+            try:
+                m = (
+                    Image.open(self.avatar_mask)
+                    .convert("L")
+                    .resize(size, Image.Resampling.LANCZOS)
+                )
+            except Exception:
+                m = None
+        if m is None:
+            m = Image.new("L", size, 0)
+            ImageDraw.Draw(m).ellipse((0, 0) + size, fill=255)
+        self._mask_cache[size] = m
+        return m
+
+    def _tba_badge(self, diameter: int) -> tuple[Image.Image, bool]:
+        """Badge TBA i informacja, czy jest w pełni nieprzezroczysty."""
         if self.tba_avatar.exists():
-            return (
-                Image.open(self.tba_avatar)
-                .convert("RGBA")
-                .resize((diameter, diameter), Image.Resampling.LANCZOS)
-            )
+            return self._scaled_asset_entry(self.tba_avatar, (diameter, diameter))
         img = Image.new("RGBA", (diameter, diameter), (255, 255, 255, 255))
         d = ImageDraw.Draw(img)
         ring = max(6, diameter // 24)
@@ -1145,7 +1303,8 @@ class MeetupImageGenerator:
             fill=self.CT,
             font=qf,
         )
-        return img
+        # rysowany zastępczy badge jest nieprzezroczysty
+        return img, True
 
     @staticmethod
     def _center_text_in_circle(
@@ -1154,21 +1313,29 @@ class MeetupImageGenerator:
         font: ImageFont.FreeTypeFont,
         diameter: int,
     ):
-        bbox = draw.textbbox((0, 0), text, font=font)
+        bbox = _text_bbox(text, font)
         w, h = bbox[2] - bbox[0], bbox[3] - bbox[1]
         return ((diameter - w) // 2, (diameter - h) // 2)
 
     def _paste_with_ring_thin(
         self, img: Image.Image, avatar: Image.Image, topleft: tuple[int, int]
     ):
-        size = avatar.width
-        shadow = Image.new("RGBA", (size + 24, size + 24), (0, 0, 0, 0))
-        d = ImageDraw.Draw(shadow)
-        d.ellipse((8, 8, size + 16, size + 16), fill=(0, 0, 0, 50))
-        shadow = shadow.filter(ImageFilter.GaussianBlur(6))
-        img.alpha_composite(shadow, (topleft[0] - 10, topleft[1] - 10))
-        ring = Image.new("RGBA", (size + 12, size + 12), (0, 0, 0, 0))
-        dr = ImageDraw.Draw(ring)
-        dr.ellipse((0, 0, size + 12, size + 12), outline=self.YA, width=3)
-        img.alpha_composite(ring, (topleft[0] - 6, topleft[1] - 6))
+        img.alpha_composite(
+            self._avatar_frame(avatar.width), (topleft[0] - 10, topleft[1] - 10)
+        )
         img.paste(avatar, topleft, avatar)
+
+    def _avatar_frame(self, size: int) -> Image.Image:
+        # rozmyty cień z ringiem na wierzchu zależy tylko od rozmiaru avatara
+        frame = self._frame_cache.get(size)
+        if frame is None:
+            frame = Image.new("RGBA", (size + 24, size + 24), (0, 0, 0, 0))
+            d = ImageDraw.Draw(frame)
+            d.ellipse((8, 8, size + 16, size + 16), fill=(0, 0, 0, 50))
+            frame = frame.filter(ImageFilter.GaussianBlur(6))
+            ring = Image.new("RGBA", (size + 12, size + 12), (0, 0, 0, 0))
+            dr = ImageDraw.Draw(ring)
+            dr.ellipse((0, 0, size + 12, size + 12), outline=self.YA, width=3)
+            frame.alpha_composite(ring, (4, 4))
+            self._frame_cache[size] = frame
+        return frame
@@ -4,7 +4,7 @@ from pathlib import Path
 import typer
 from typing_extensions import Annotated
 
-from pyldz.config import AppConfig
+from pyldz.config import get_config
 from pyldz.hugo_generator import HugoMeetupGenerator
 from pyldz.logging_config import setup_logging
 from pyldz.models import GoogleSheetsAPI, GoogleSheetsRepository, LocationRepository
@@ -38,7 +38,7 @@ def generate(
     log.info("🚀 Generating Hugo meetup files...")
     log.info("=" * 50)
 
-    config = AppConfig()
+    config = get_config()
 
     location_repo = LocationRepository(config.hugo.data_dir / "locations")
     repository = GoogleSheetsRepository(
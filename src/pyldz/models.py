@@ -1,6 +1,7 @@
 import datetime
 import io
 import logging
+import os
 import re
 from enum import Enum, StrEnum
 from pathlib import Path
@@ -19,6 +20,43 @@ from pyldz.config import GoogleSheetsConfig
 
 log = logging.getLogger(__name__)
 
+# Location files are plain read-only data; the safe loader skips the round-trip
+# bookkeeping and is shared across repository instances.
+_yaml = YAML(typ="safe")
+
+
+def is_single_yaml_document(text: str) -> bool:
+    """Whether a YAML file can be joined into a multi-document stream.
+
+    The file must have some content and no ``---``/``...`` markers or ``%``
+    directives of its own, so that it yields exactly one document.
+    """
+    has_content = False
+    for line in text.splitlines():
+        if line.startswith(("---", "...", "%")):
+            return False
+        stripped = line.strip()
+        if stripped and not stripped.startswith("#"):
+            has_content = True
+    return has_content
+
+
+def load_yaml_files_together(yaml: YAML, texts: list[str]) -> list | None:
+    """Parse several YAML files as one multi-document stream.
+
+    Returns one document per text, or None when joining the texts could change
+    what they parse to; callers then parse each file on its own. Every text
+    must be a single document and end with a newline, so that joining them
+    with ``---`` lines leaves trailing block scalars (``|``, ``|+``) intact.
+    """
+    if not all(text.endswith("\n") and is_single_yaml_document(text) for text in texts):
+        return None
+    documents = list(yaml.load_all("---\n".join(texts)))
+    if len(documents) != len(texts):
+        return None
+    return documents
+
+
 FALLBACK_PHOTO_PATH = (
     Path(__file__).parent.parent.parent
     / "page"
@@ -317,7 +355,7 @@ class GoogleSheetsAPI:
 
         if credentials is None or not credentials.valid:
             flow = InstalledAppFlow.from_client_secrets_file(
-                str(self.config.credentials_path), self.scopes
+                str(self.config.ensure_credentials_exist()), self.scopes
             )
             credentials = flow.run_local_server(port=0)
 
@@ -390,14 +428,18 @@ class GoogleSheetsRepository:
     def __init__(self, api: GoogleSheetsAPI, location_repo: "LocationRepository"):
         self.api = api
         self.location_repo = location_repo
+        # Talks sheet rows, fetched once and shared by every lookup
+        self._talks_cache: list[_TalkRow] | None = None
 
     def _fetch_meetups_data(self) -> list[_MeetupRow]:
         rows = self.api.fetch_data(Tables.MEETUPS)
         return [_MeetupRow.model_validate(row) for row in rows]
 
     def _fetch_talks_data(self) -> list[_TalkRow]:
-        rows = self.api.fetch_data(Tables.TALKS)
-        return [_TalkRow.model_validate(row) for row in rows]
+        if self._talks_cache is None:
+            rows = self.api.fetch_data(Tables.TALKS)
+            self._talks_cache = [_TalkRow.model_validate(row) for row in rows]
+        return self._talks_cache
 
     def _get_talks_for_meetup(
         self, meetup_id: str, talks_data: list[_TalkRow]
@@ -491,25 +533,46 @@ class LocationRepository:
 
     def _load_all_locations(self) -> None:
         """Load all location YAML files into cache."""
-        yaml = YAML()
         if not self.locations_dir.exists():
             log.warning(f"Locations directory not found: {self.locations_dir}")
             return
 
-        for location_file in self.locations_dir.glob("*.yaml"):
-            location_id = location_file.stem
+        sources: list[tuple[str, str]] = []
+        with os.scandir(self.locations_dir) as entries:
+            # Sorted so the batched stream and the log order are reproducible
+            for entry in sorted(entries, key=lambda entry: entry.name):
+                if not entry.name.endswith(".yaml") or not entry.is_file():
+                    continue
+                location_id = entry.name.removesuffix(".yaml")
+                try:
+                    with open(entry.path, encoding="utf-8") as f:
+                        sources.append((location_id, f.read()))
+                except Exception as e:
+                    log.error(f"Failed to load location {location_id}: {e}")
+
+        # Parse every file in one multi-document stream when that is known to
+        # give the same result; otherwise parse the files one by one
+        documents = None
+        if len(sources) > 1:
+            try:
+                documents = load_yaml_files_together(
+                    _yaml, [text for _, text in sources]
+                )
+            except Exception as e:
+                log.debug(f"Batch location parse failed, parsing files separately: {e}")
+
+        for index, (location_id, text) in enumerate(sources):
             try:
-                with open(location_file, encoding="utf-8") as f:
-                    data = yaml.load(f)
-                    if data:
-                        # Map name_pl/name_en to pl/en for MultiLanguage model
-                        multi_lang_data = {
-                            "pl": data.get("name_pl", ""),
-                            "en": data.get("name_en", ""),
-                        }
-                        location = Location(name=MultiLanguage(**multi_lang_data))
-                        self._locations_cache[location_id] = location
-                        log.debug(f"Loaded location: {location_id}")
+                data = documents[index] if documents is not None else _yaml.load(text)
+                if data:
+                    # Map name_pl/name_en to pl/en for MultiLanguage model
+                    multi_lang_data = {
+                        "pl": data.get("name_pl", ""),
+                        "en": data.get("name_en", ""),
+                    }
+                    location = Location(name=MultiLanguage(**multi_lang_data))
+                    self._locations_cache[location_id] = location
+                    log.debug("Loaded location: %s", location_id)
             except Exception as e:
                 log.error(f"Failed to load location {location_id}: {e}")
 
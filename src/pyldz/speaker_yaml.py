@@ -77,7 +77,7 @@ def write_speaker_yaml(speaker: Speaker, page_dir: Path = Path("page")) -> Path:
     yaml_content = build_speaker_yaml_content(speaker, avatar_rel)
 
     yaml_path = data_speakers_dir / f"{speaker.id}.yaml"
-    yaml_path.write_text(yaml_content, encoding="utf-8")
+    yaml_path.write_bytes(yaml_content.encode("utf-8"))
     return yaml_path
 
 
@@ -16,7 +16,7 @@ def runner():
 
 @pytest.fixture
 def mock_config(tmp_path):
-    with patch("pyldz.main.AppConfig") as mock:
+    with patch("pyldz.main.get_config") as mock:
         config_instance = Mock()
         config_instance.google_sheets = Mock()
         config_instance.hugo = Mock()
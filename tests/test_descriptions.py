@@ -9,6 +9,7 @@ from pyldz.descriptions.generators import (
     AGENDA_TWO_TALKS,
     MeetupDescriptionGenerator,
     SocialMediaLinks,
+    SponsorRepository,
 )
 from pyldz.descriptions.models import MeetupDescriptions
 from pyldz.descriptions.repository import DescriptionRepository
@@ -136,6 +137,163 @@ def test_social_media_links():
     assert SocialMediaLinks.FACEBOOK == "https://www.facebook.com/pythonlodz"
 
 
+def test_sponsor_repository_for_dir_is_shared_and_refreshed(tmp_path):
+    """Test sponsor repositories are reused per directory and pick up edits."""
+    sponsor_file = tmp_path / "acme.yaml"
+    sponsor_file.write_text("name: Acme\n", encoding="utf-8")
+
+    repo = SponsorRepository.for_dir(tmp_path)
+    assert SponsorRepository.for_dir(tmp_path) is repo
+    assert repo.get_sponsor("acme") == {"name": "Acme"}
+
+    sponsor_file.write_text("name: Acme Corporation\n", encoding="utf-8")
+    repo = SponsorRepository.for_dir(tmp_path)
+    assert repo.get_sponsor("acme") == {"name": "Acme Corporation"}
+
+
+def test_sponsor_repository_for_dir_keeps_later_cache_file(tmp_path):
+    """Test a cache file passed to an existing shared repository is used."""
+    sponsors_dir = tmp_path / "sponsors"
+    sponsors_dir.mkdir()
+    (sponsors_dir / "acme.yaml").write_text("name: Acme\n", encoding="utf-8")
+    cache_file = tmp_path / "sponsors.json"
+
+    SponsorRepository.for_dir(sponsors_dir)
+    repo = SponsorRepository.for_dir(sponsors_dir, cache_file)
+
+    assert repo.get_sponsor("acme") == {"name": "Acme"}
+    assert cache_file.exists()
+
+
+def test_sponsor_repository_loads_sponsors_on_demand(tmp_path):
+    """Test sponsors are read on first access instead of at construction."""
+    repo = SponsorRepository(tmp_path)
+    (tmp_path / "acme.yaml").write_text("name: Acme\n", encoding="utf-8")
+
+    assert repo.get_sponsor("acme") == {"name": "Acme"}
+    assert repo.get_sponsor("missing") is None
+
+
+def test_sponsor_repository_warns_about_missing_directory(tmp_path, caplog):
+    """Test a misconfigured sponsors directory is reported."""
+    repo = SponsorRepository(tmp_path / "missing")
+
+    assert repo.get_sponsor("acme") is None
+    assert "Sponsors directory not found" in caplog.text
+
+
+def test_sponsor_repository_reuses_json_cache(tmp_path, monkeypatch):
+    """Test parsed sponsors are persisted and reused without parsing YAML again."""
+    from pyldz.descriptions import generators
+
+    sponsors_dir = tmp_path / "sponsors"
+    sponsors_dir.mkdir()
+    (sponsors_dir / "acme.yaml").write_text("name: Acme\n", encoding="utf-8")
+    cache_file = tmp_path / ".cache" / "sponsors.json"
+
+    assert SponsorRepository(sponsors_dir, cache_file).get_sponsor("acme")
+    assert cache_file.exists()
+
+    monkeypatch.setattr(generators, "_SPONSOR_FILE_CACHE", {})
+    monkeypatch.setattr(generators._yaml, "load", None)
+    repo = SponsorRepository(sponsors_dir, cache_file)
+    assert repo.get_sponsor("acme") == {"name": "Acme"}
+
+
+@pytest.mark.parametrize("content", ["[]", '{"x.yaml": [1, 2]}', '{"x.yaml": 3}'])
+def test_sponsor_repository_ignores_malformed_json_cache(tmp_path, content):
+    """Test a cache file with the wrong shape is skipped instead of crashing."""
+    (tmp_path / "acme.yaml").write_text("name: Acme\n", encoding="utf-8")
+    cache_file = tmp_path / "sponsors.json"
+    cache_file.write_text(content, encoding="utf-8")
+
+    assert SponsorRepository(tmp_path, cache_file).get_sponsor("acme") == {
+        "name": "Acme"
+    }
+
+
+def test_sponsor_repository_writes_json_cache_once_per_batch(tmp_path, monkeypatch):
+    """Test the cache file is written once for several parsed sponsors."""
+    (tmp_path / "acme.yaml").write_text("name: Acme\n", encoding="utf-8")
+    (tmp_path / "globex.yaml").write_text("---\nname: Globex\n", encoding="utf-8")
+    repo = SponsorRepository(tmp_path, tmp_path / "sponsors.json")
+    writes = []
+    monkeypatch.setattr(
+        SponsorRepository, "_write_cache_file", lambda self, path: writes.append(path)
+    )
+
+    repo.get_sponsors(["acme", "globex"])
+    repo.get_sponsors(["acme", "globex"])
+
+    assert writes == [tmp_path / "sponsors.json"]
+
+
+def test_sponsor_repository_does_not_cache_non_json_data(tmp_path, monkeypatch):
+    """Test YAML values JSON cannot hold are not read back as strings."""
+    from pyldz.descriptions import generators
+
+    (tmp_path / "acme.yaml").write_text(
+        "name: Acme\nsince: 2020-01-02\n", encoding="utf-8"
+    )
+    cache_file = tmp_path / "sponsors.json"
+    SponsorRepository(tmp_path, cache_file).get_sponsor("acme")
+
+    monkeypatch.setattr(generators, "_SPONSOR_FILE_CACHE", {})
+    repo = SponsorRepository(tmp_path, cache_file)
+    assert repo.get_sponsor("acme") == {"name": "Acme", "since": date(2020, 1, 2)}
+
+
+def test_sponsor_repository_get_sponsors_batch(tmp_path):
+    """Test loading several sponsors, including one that cannot be batched."""
+    (tmp_path / "acme.yaml").write_text("name: Acme\n", encoding="utf-8")
+    (tmp_path / "globex.yaml").write_text("name: Globex\n", encoding="utf-8")
+    (tmp_path / "initech.yaml").write_text("---\nname: Initech\n", encoding="utf-8")
+
+    repo = SponsorRepository(tmp_path)
+    sponsors = repo.get_sponsors(["acme", "missing", "globex", "initech"])
+
+    assert sponsors == [
+        {"name": "Acme"},
+        None,
+        {"name": "Globex"},
+        {"name": "Initech"},
+    ]
+
+
+def test_sponsor_repository_get_sponsors_keeps_files_apart(tmp_path):
+    """Test a blank and a multi-document file do not shift other sponsors."""
+    (tmp_path / "acme.yaml").write_text("", encoding="utf-8")
+    (tmp_path / "globex.yaml").write_text(
+        "name: Globex\n---\nname: Globex 2\n", encoding="utf-8"
+    )
+    (tmp_path / "initech.yaml").write_text("name: Initech\n", encoding="utf-8")
+
+    repo = SponsorRepository(tmp_path)
+    sponsors = repo.get_sponsors(["acme", "globex", "initech"])
+
+    assert sponsors == [None, None, {"name": "Initech"}]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "description: |\n  line one\n  line two",
+        "description: |+\n  line one\n  line two\n\n",
+    ],
+)
+def test_sponsor_repository_batch_matches_single_file_parse(tmp_path, text):
+    """Test batched parsing keeps block scalars exactly as a per-file parse."""
+    from pyldz.descriptions.generators import _yaml
+
+    (tmp_path / "acme.yaml").write_text(text, encoding="utf-8")
+    (tmp_path / "globex.yaml").write_text("name: Globex\n", encoding="utf-8")
+
+    repo = SponsorRepository(tmp_path)
+    sponsors = repo.get_sponsors(["acme", "globex"])
+
+    assert sponsors == [_yaml.load(text), {"name": "Globex"}]
+
+
 def test_description_generator_two_talks(
     sample_meetup_two_talks, sample_speaker, tmp_path
 ):
@@ -1,4 +1,5 @@
 import datetime
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -338,3 +339,81 @@ def test_generate_featured_image_both_languages(temp_assets_dir, sample_meetup):
     assert pl_image.format == "PNG"
     assert en_image.format == "PNG"
     assert pl_image.size == en_image.size
+
+
+def test_load_font_reuses_parsed_font(tmp_path):
+    assets_dir = Path(__file__).parents[1] / "page" / "assets"
+    generator = MeetupImageGenerator(assets_dir, tmp_path)
+
+    first = generator._load_font(generator.font_bold, 40)
+
+    assert generator._load_font(generator.font_bold, 40) is first
+    assert generator._load_font(generator.font_bold, 41) is not first
+
+
+def test_prepare_avatars_processes_each_speaker_once(temp_assets_dir, monkeypatch):
+    from io import BytesIO
+
+    from pyldz import face_centering
+
+    img_bytes = BytesIO()
+    Image.new("RGB", (100, 100), (255, 0, 0)).save(img_bytes, format="PNG")
+    speakers = [
+        Speaker(
+            id=f"speaker-{i}",
+            name=f"Speaker {i}",
+            bio="",
+            avatar=File(name="avatar.png", content=img_bytes.getvalue()),
+            social_links=[],
+        )
+        for i in range(3)
+    ]
+
+    centered = []
+
+    def fake_center(img):
+        centered.append(img.size)
+        return img
+
+    monkeypatch.setattr(face_centering, "detect_and_center_square", fake_center)
+    generator = MeetupImageGenerator(temp_assets_dir)
+
+    generator.prepare_avatars(speakers + speakers)
+
+    assert len(centered) == len(speakers)
+    for speaker in speakers:
+        assert (generator.cache_dir / f"{speaker.id}.png").exists()
+
+
+def test_avatar_writes_sized_cache_atomically(temp_assets_dir, tmp_path):
+    cache_dir = tmp_path / "cache"
+    generator = MeetupImageGenerator(temp_assets_dir, cache_dir)
+    Image.new("RGBA", (100, 100), (255, 0, 0, 255)).save(cache_dir / "jane.png")
+    speaker = Speaker(
+        id="jane",
+        name="Jane",
+        bio="",
+        avatar=File(name="avatar.png", content=b""),
+        social_links=[],
+    )
+
+    avatar = generator._avatar(speaker, (50, 50))
+
+    sized_files = [p.name for p in generator.sized_cache_dir.iterdir()]
+    assert sized_files == ["jane@50x50.png"]
+    with Image.open(generator.sized_cache_dir / "jane@50x50.png") as cached:
+        assert cached.tobytes() == avatar.tobytes()
+
+
+def test_generator_pickles_settings_without_image_caches(temp_assets_dir):
+    import pickle
+
+    generator = MeetupImageGenerator(temp_assets_dir, png_compress_level=1)
+    generator._circle_mask((10, 10))
+
+    clone = pickle.loads(pickle.dumps(generator))
+
+    assert clone.png_compress_level == 1
+    assert clone.asset_paths == generator.asset_paths
+    assert clone._mask_cache == {}
+    assert generator._mask_cache
@@ -611,6 +611,16 @@ def test_configuration_validation(app_config):
     assert app_config.dry_run is True
 
 
+def test_missing_credentials_are_reported_on_use(tmp_path):
+    """Test that a missing credentials file is only reported when it is needed."""
+    config = GoogleSheetsConfig(
+        sheet_id="test_sheet_id", credentials_path=tmp_path / "missing.json"
+    )
+
+    with pytest.raises(FileNotFoundError, match="Credentials file not found"):
+        config.ensure_credentials_exist()
+
+
 @patch("pyldz.models.build")
 def test_error_handling_and_resilience(mock_build, repository):
     """Test error handling and resilience of the complete flow."""
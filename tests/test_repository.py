@@ -288,3 +288,73 @@ def test_get_speakers_for_meetup_different_meetup(repository: GoogleSheetsReposi
     ]
 
     assert result == expected
+
+
+def test_location_repository_loads_all_files(tmp_path):
+    (tmp_path / "a.yaml").write_text("name_pl: A PL\nname_en: A EN\n")
+    (tmp_path / "b.yaml").write_text("---\nname_pl: B PL\nname_en: B EN\n")
+    (tmp_path / "c.yaml").write_text("name_pl: C PL\nname_en: C EN\n")
+    (tmp_path / "notes.txt").write_text("ignored")
+
+    location_repo = LocationRepository(tmp_path)
+
+    assert location_repo.get_location("a") == Location(
+        name=MultiLanguage(pl="A PL", en="A EN")
+    )
+    assert location_repo.get_location("b") == Location(
+        name=MultiLanguage(pl="B PL", en="B EN")
+    )
+    assert location_repo.get_location("c") == Location(
+        name=MultiLanguage(pl="C PL", en="C EN")
+    )
+    assert location_repo.get_location("notes") is None
+
+
+def test_repository_fetches_talks_once(repository: GoogleSheetsRepository):
+    calls = []
+    fetch_data = repository.api.fetch_data
+
+    def counting_fetch_data(table_name: str) -> list[dict]:
+        calls.append(table_name)
+        return fetch_data(table_name)
+
+    repository.api.fetch_data = counting_fetch_data
+
+    repository.get_all_enabled_meetups()
+    repository.get_speakers_for_meetup("58", repository._fetch_talks_data())
+
+    assert calls.count("talks") == 1
+
+
+def test_location_repository_keeps_files_apart_when_not_batchable(tmp_path):
+    (tmp_path / "a.yaml").write_text("")
+    (tmp_path / "b.yaml").write_text("name_pl: B\n---\nname_pl: B2\n")
+    (tmp_path / "c.yaml").write_text("name_pl: C PL\nname_en: C EN\n")
+
+    location_repo = LocationRepository(tmp_path)
+
+    assert location_repo.get_location("a") is None
+    assert location_repo.get_location("b") is None
+    assert location_repo.get_location("c") == Location(
+        name=MultiLanguage(pl="C PL", en="C EN")
+    )
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "name_pl: |\n  line one\n  line two",
+        "name_pl: |+\n  line one\n  line two\n\n",
+        "name_pl: >\n  line one\n  line two\n",
+    ],
+)
+def test_location_repository_batch_matches_single_file_parse(tmp_path, text):
+    from pyldz.models import _yaml
+
+    (tmp_path / "a.yaml").write_text(text)
+    (tmp_path / "b.yaml").write_text("name_pl: B PL\nname_en: B EN\n")
+
+    location_repo = LocationRepository(tmp_path)
+
+    expected = _yaml.load(text)["name_pl"]
+    assert location_repo.get_location("a").name.pl == expected